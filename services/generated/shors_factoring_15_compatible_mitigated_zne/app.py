@@ -1,13 +1,18 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
 from pydantic import BaseModel
 from typing import Dict, List, Optional, Any, Union
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
 import uuid
 from datetime import datetime
 import asyncio
 import time
+from functools import lru_cache
 
 # This microservice was generated by quantum-cli-sdk service generate command
 # Generated on: 2025-04-08 03:56:21
@@ -36,12 +41,20 @@ except ImportError:
     BRAKET_AVAILABLE = False
 
 # Setup logging
+# Records bound for the log file are enqueued and written by a background listener,
+# so logging from request handlers never blocks on disk I/O. The QueueHandler formats
+# each record before enqueueing, so the file handler writes the message as-is.
+log_queue = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(log_queue, logging.FileHandler("microservice.log"))
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(),
-        logging.FileHandler("microservice.log")
+        logging.handlers.QueueHandler(log_queue)
     ]
 )
 logger = logging.getLogger(__name__)
@@ -75,6 +88,29 @@ class ResultsResponse(BaseModel):
     execution_time: Optional[float] = None
     error: Optional[str] = None
 
+# Circuits at or above this width are routed to the GPU statevector backend when one is available
+GPU_QUBIT_THRESHOLD = int(os.environ.get("GPU_QUBIT_THRESHOLD", "20"))
+# Set FORCE_CPU_BACKEND=1 to keep every Qiskit job on the CPU even when a GPU was detected
+FORCE_CPU_BACKEND_ENV = "FORCE_CPU_BACKEND"
+
+# Job IDs are drawn from a pre-filled entropy pool: one os.urandom() call per 1024 IDs
+# instead of one per request
+UUID_POOL_SIZE = 16 * 1024
+_uuid_pool = b""
+_uuid_pool_index = UUID_POOL_SIZE
+_uuid_pool_lock = threading.Lock()
+
+def fast_uuid4():
+    global _uuid_pool, _uuid_pool_index
+    with _uuid_pool_lock:
+        if _uuid_pool_index >= UUID_POOL_SIZE:
+            _uuid_pool = os.urandom(UUID_POOL_SIZE)
+            _uuid_pool_index = 0
+        raw = _uuid_pool[_uuid_pool_index:_uuid_pool_index + 16]
+        _uuid_pool_index += 16
+    # uuid.UUID sets the RFC 4122 variant and version 4 bits
+    return uuid.UUID(bytes=raw, version=4)
+
 # In-memory job store (in production, use a database)
 jobs = {}
 
@@ -118,7 +154,7 @@ async def run_circuit(request: CircuitRequest, background_tasks: BackgroundTasks
         raise HTTPException(status_code=400, detail="Braket simulator not available")
     
     # Generate job ID
-    job_id = str(uuid.uuid4())
+    job_id = str(fast_uuid4())
     
     # Save circuit to file
     circuit_path = f"circuits/{job_id}.qasm"
@@ -294,6 +330,35 @@ async def execute_circuit(job_id: str):
         with open(result_path, "w") as f:
             json.dump({"error": str(e)}, f, indent=2)
 
+# Qiskit backend selection
+@lru_cache(maxsize=1)
+def gpu_available():
+    # qiskit-aer-gpu reports "GPU" among the available devices when CUDA is usable
+    try:
+        return "GPU" in Aer.get_backend('aer_simulator').available_devices()
+    except Exception as e:
+        logger.debug(f"Could not query Aer devices: {e}")
+        return False
+
+@lru_cache(maxsize=1)
+def gpu_statevector_backend():
+    # A simulator of our own: Aer.get_backend() returns shared instances, and setting
+    # device='GPU' on one of those would move every later job that uses it to the GPU
+    from qiskit.providers.aer import AerSimulator
+    return AerSimulator(method='statevector', device='GPU', cuStateVec_enable=True)
+
+def cpu_backend_forced():
+    # Read on every call: gpu_available() is cached for the life of the process
+    return os.environ.get(FORCE_CPU_BACKEND_ENV, "").lower() in ("1", "true", "yes")
+
+def select_qiskit_backend(circuit):
+    # Large statevector simulations are data-parallel, so offload them to the GPU
+    if (circuit.num_qubits >= GPU_QUBIT_THRESHOLD and not cpu_backend_forced()
+            and gpu_available()):
+        logger.info(f"Using GPU statevector backend for {circuit.num_qubits}-qubit circuit")
+        return gpu_statevector_backend()
+    return Aer.get_backend('qasm_simulator')
+
 # Qiskit execution
 async def execute_with_qiskit(circuit_path, parameters, shots):
     import time
@@ -315,7 +380,7 @@ async def execute_with_qiskit(circuit_path, parameters, shots):
         circuit.measure_all()
     
     # Run simulation
-    simulator = Aer.get_backend('qasm_simulator')
+    simulator = select_qiskit_backend(circuit)
     job = execute(circuit, simulator, shots=shots)
     result = job.result()
     
@@ -2,25 +2,38 @@
 Quantum SDK - A command-line interface and software development kit for quantum computing.
 """
 
+import importlib
+
 __version__ = "0.3.7"
 
-from .quantum_circuit import QuantumCircuit
-from .simulator import run_simulation
-from .config import get_config, initialize_config
-from .cache import get_cache, initialize_cache
-from .transpiler import get_pass_manager, initialize_transpiler
-from .plugin_system import discover_plugins, register_command_plugin, get_registered_command_plugins
-
-__all__ = [
-    'QuantumCircuit',
-    'run_simulation',
-    'get_config',
-    'initialize_config',
-    'get_cache',
-    'initialize_cache',
-    'get_pass_manager',
-    'initialize_transpiler',
-    'discover_plugins',
-    'register_command_plugin',
-    'get_registered_command_plugins',
-]
+# Public names are resolved on first access (PEP 562) so that importing the
+# CLI entry point does not pull in numpy/qiskit through quantum_circuit and
+# simulator when the invoked command never touches them.
+_LAZY_ATTRS = {
+    'QuantumCircuit': '.quantum_circuit',
+    'run_simulation': '.simulator',
+    'get_config': '.config',
+    'initialize_config': '.config',
+    'get_cache': '.cache',
+    'initialize_cache': '.cache',
+    'get_pass_manager': '.transpiler',
+    'initialize_transpiler': '.transpiler',
+    'discover_plugins': '.plugin_system',
+    'register_command_plugin': '.plugin_system',
+    'get_registered_command_plugins': '.plugin_system',
+}
+
+__all__ = list(_LAZY_ATTRS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
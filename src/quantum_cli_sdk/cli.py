@@ -4,128 +4,264 @@ Command-line interface for Quantum CLI SDK.
 """
 
 import argparse
-import json
 import sys
 import logging
 import os
-from pathlib import Path
-import datetime
+import stat
+import shutil
+import functools
+import operator
+import pickle
 
 from . import __version__
 
-# Import command modules or specific functions
-from .commands import run
-from .commands import generate_ir as ir_generate_mod
-from .commands import validate as ir_validate_mod
-from .commands import template
-from .commands import init
-from .commands import security_scan as security_scan_mod
-from .commands import simulate as simulate_mod
-from .commands.ir import optimize as ir_optimize_mod
-from .commands.ir import mitigate as ir_mitigate_mod
-from .commands import generate_tests as test_generate_mod
-from .commands import estimate_resources as analyze_resources_mod
-from .commands import calculate_cost
-from .commands import benchmark as analyze_benchmark_mod
-from .commands import finetune as ir_finetune_mod
-# from .commands import hw_run
-# from .commands import mitigate
-# from .commands import optimize as ir_optimize_mod
-# from .commands import mitigate as ir_mitigate_mod
-# from .commands import finetune as ir_finetune_mod
-# from .commands import resources as analyze_resources_mod
-# from .commands import cost as analyze_cost_mod
-# from .commands import benchmark as analyze_benchmark_mod
-# from .commands import test_cmd as test_mod
-# from .commands import service as service_mod
-# from .commands import package as package_mod
-# from .commands import hub as hub_mod
-
-from .config import get_config, initialize_config
-from .cache import get_cache, initialize_cache
-from .transpiler import get_pass_manager, initialize_transpiler
-from .plugin_system import discover_plugins, register_command_plugin, get_registered_command_plugins
-from .plugin_system import setup_plugin_subparsers, execute_plugin_command
-from .interactive import start_shell
-from .visualizer import visualize_circuit_command, visualize_results_command
-from .versioning import init_repo, commit_circuit, get_circuit_version, list_circuit_versions, checkout_version
-from .marketplace import browse_marketplace, search_marketplace, get_algorithm_details, download_algorithm, publish_algorithm, submit_review, configure_marketplace
-from .sharing import share_circuit, list_my_shared_circuits, list_shared_with_me, get_shared_circuit_details, update_share_permissions, remove_collaborator, unshare_circuit, get_activity_history, search_shared_circuits, SharingPermission
-from .simulator import run_simulation
-from . import circuit_comparison
-from . import hardware_selector
-from . import job_management
-from . import config_manager
-from . import dependency_analyzer
-from . import progress
-from . import output_formatter
-from . import logging_config
-from .utils import find_first_file
-
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Heavy subsystems (qiskit, numpy, matplotlib, provider SDKs) and the command
+# modules are imported inside the handlers that need them so that --help and
+# --version stay fast.
+
 logger = logging.getLogger(__name__)
 
-def initialize_sdk():
-    """Initialize the SDK components."""
-    # Initialize configuration
-    config = initialize_config()
-    
-    # Set log level based on active profile
-    log_level = config.get_setting("log_level", "INFO")
-    numeric_level = getattr(logging, log_level.upper(), None)
-    if isinstance(numeric_level, int):
-        logging.getLogger().setLevel(numeric_level)
-        logger.info(f"Set log level to {log_level}")
-    
-    # Initialize cache with settings from config
-    cache_dir = config.get_setting("cache_dir", ".quantum_cache")
-    cache_enabled = config.get_setting("caching", True)
-    max_age = config.get_setting("cache_max_age", None)  # In seconds, None means no expiration
+_HOME_PLUGIN_DIR = os.path.join(os.path.expanduser("~"), ".quantum-cli", "plugins")
+
+_PARSER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".quantum-cli", "parser-cache")
+_DEFAULTS_CONFIG_FILE = os.path.join(os.path.expanduser("~"), ".quantum-cli", "config.json")
+# Extensions config.load_config() looks for in quantum_config.* files
+_CONFIG_FILE_EXTS = (".yaml", ".yml", ".json")
+
+_LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
+# Top-level command help, shared by the full parsers and the name-only listing
+_COMMAND_HELP = {
+    "ir": "Commands for managing Intermediate Representation (IR)",
+    "run": "Run quantum circuits on simulators or hardware",
+    "analyze": "Analyze quantum circuit properties",
+    "test": "Generate and run tests for quantum circuits",
+    "service": "Generate and test microservice wrappers",
+    "package": "Package quantum applications",
+    "hub": "Interact with the Quantum Hub",
+    "init": "Initialize a new quantum project",
+    "compare": "Compare quantum circuits",
+    "config": "Manage configuration and default parameters",
+    "deps": "Analyze dependencies",
+    "find-hardware": "Find suitable quantum hardware",
+    "jobs": "Manage quantum execution jobs",
+    "marketplace": "Quantum algorithm marketplace",
+    "share": "Share quantum circuits",
+    "template": "Manage circuit templates (Placeholder)",
+    "version": "Manage quantum circuit versions",
+    "visualize": "Visualize circuits or results",
+    "security": "Commands for security analysis",
+}
+
+# Shared argparse choices
+_RATING_CHOICES = tuple(range(1, 6))
+_FORMAT_TEXT_JSON = ("text", "json")
+_FORMAT_TEXT_JSON_MD = ("text", "json", "markdown")
+_OUTPUT_FMT_CSV = ("text", "json", "csv")
+_PERMISSIONS = ("read_only", "read_write", "admin")
+_PLATFORMS = ("ibm", "aws", "google")
+_PLATFORMS_ALL = ("all",) + _PLATFORMS
+
+# Commands that only read or write config, project and requirements files,
+# so main() skips config/cache/transpiler/plugin initialization for them
+_SDK_FREE_COMMANDS = frozenset({"config", "init", "deps"})
+
+def _default_param(command, param_name):
+    """config_manager.get_default_param(), importing config_manager on first use."""
+    from . import config_manager
+    return config_manager.get_default_param(command, param_name)
+
+def _config_value(path):
+    """config_manager.get_config_value(), importing config_manager on first use."""
+    from . import config_manager
+    return config_manager.get_config_value(path)
+
+# Options whose default comes from the config: (command, dest) -> lookup.
+# Their parser default is None and _apply_config_defaults() fills them in
+# after parsing, so building a parser never reads the config.
+_CONFIG_DEFAULTS = {
+    ("jobs", "storage_path"): lambda: _default_param("jobs", "storage_path"),
+    ("jobs", "interval"): lambda: _default_param("jobs", "monitor_interval") or 5,
+    ("version", "repo_path"): lambda: _default_param("version", "repo_path"),
+    ("version", "author"): lambda: _config_value("user.name"),
+    ("marketplace", "sort_by"): lambda: _default_param("marketplace", "sort_by"),
+    ("share", "storage_path"): lambda: _default_param("share", "storage_path"),
+    ("share", "repo_path"): lambda: _default_param("version", "repo_path"),
+    ("share", "permission"): lambda: _default_param("share", "permission"),
+    ("compare", "output_format"): lambda: _default_param("compare", "output_format"),
+    ("find-hardware", "criteria"): lambda: _default_param("find-hardware", "criteria"),
+}
+_CONFIG_DEFAULT_COMMANDS = frozenset(command for command, _ in _CONFIG_DEFAULTS)
+
+def _apply_config_defaults(args):
+    """Set each option in _CONFIG_DEFAULTS that args left at None to its config default."""
+    for (command, dest), lookup in _CONFIG_DEFAULTS.items():
+        if command == args.command and getattr(args, dest, False) is None:
+            setattr(args, dest, lookup())
+
+# Lowercase spellings accepted for booleans in `config set`
+_BOOL_VALUES = {"true": True, "false": False}
+
+def _parse_config_value(value):
+    """Convert a `config set` value to bool/int/float when it looks like one."""
+    import ast
+
+    try:
+        parsed = ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        return _BOOL_VALUES.get(value.lower(), value)
+    # Quoted strings, lists etc. are stored as typed
+    return parsed if isinstance(parsed, (bool, int, float)) else value
+
+# Options read by `run simulate`, fetched in one C-level call
+_RUN_SIMULATE_ARGS = operator.attrgetter("qasm_file", "backend", "output", "shots")
+
+def _json_object(value):
+    """argparse type for options that take a JSON object; decodes it once at parse time."""
+    import json
+
+    try:
+        decoded = json.loads(value)
+    except json.JSONDecodeError as e:
+        raise argparse.ArgumentTypeError(f"invalid JSON: {e}")
+    if not isinstance(decoded, dict):
+        raise argparse.ArgumentTypeError("must be a JSON object (dictionary)")
+    return decoded
+
+def _split_csv(value, default=None):
+    """Split a comma-separated option value, returning default when it is empty."""
+    return value.split(",") if value else default
+
+@functools.lru_cache(maxsize=None)
+def _path_is_dir(path):
+    """Cached directory check for paths probed on every startup."""
+    try:
+        return stat.S_ISDIR(os.stat(path).st_mode)
+    except OSError:
+        return False
+
+def _configure_logging():
+    """Set up logging here rather than at import so --help/--version never build handlers."""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+        )
+
+# What initialize_sdk() has already set up in this process
+_sdk_config = None
+_sdk_profile = None
+_transpiler_initialized = False
+_all_plugins_loaded = False
+_plugin_commands_loaded = set()
+
+def initialize_sdk(use_plugin_cache=True, need_transpiler=True, need_plugins=True, command=None,
+                   profile=None):
+    """Initialize the SDK components.
+
+    Config and cache are always initialized; the transpiler and plugin
+    discovery can be skipped for commands that do not use them. When command
+    is given, a warm plugin cache only loads the plugin providing it.
+    profile, if given, is activated instead of QUANTUM_PROFILE.
+    Each part is set up at most once per process, so a later call only adds
+    what earlier calls skipped; the config is reloaded if profile changes.
+    """
+    global _sdk_config, _sdk_profile, _transpiler_initialized, _all_plugins_loaded
+
+    if _sdk_config is None or profile != _sdk_profile:
+        _sdk_config = _initialize_config_and_cache(profile)
+        _sdk_profile = profile
+    config = _sdk_config
     
-    if cache_enabled:
-        cache = initialize_cache(cache_dir, max_age)
-        logger.info(f"Cache initialized in {cache_dir}" + 
-                   (f" with {max_age}s expiration" if max_age else " with no expiration"))
-    else:
-        logger.info("Caching is disabled in the current profile")
+    if need_transpiler and not _transpiler_initialized:
+        from .transpiler import initialize_transpiler
+
+        # Initialize transpiler with optimization level from config
+        opt_level = config.get_setting("optimization_level", 1)
+        initialize_transpiler()
+        _transpiler_initialized = True
+        logger.info("Transpiler initialized with optimization level %s", opt_level)
     
-    # Initialize transpiler with optimization level from config
-    opt_level = config.get_setting("optimization_level", 1)
-    transpiler = initialize_transpiler()
-    logger.info(f"Transpiler initialized with optimization level {opt_level}")
+    if not need_plugins or _all_plugins_loaded or (command is not None and command in _plugin_commands_loaded):
+        return config
     
+    from .plugin_system import discover_plugins
+
     # Discover and load plugins from configured paths
     plugin_paths = config.get_plugin_paths()
-    home_plugin_dir = os.path.expanduser("~/.quantum-cli/plugins")
+    known_paths = set(plugin_paths)
     
     # Always check home directory for plugins if not explicitly included
-    if home_plugin_dir not in plugin_paths and os.path.isdir(home_plugin_dir):
-        plugin_paths.append(home_plugin_dir)
+    if _HOME_PLUGIN_DIR not in known_paths and _path_is_dir(_HOME_PLUGIN_DIR):
+        plugin_paths.append(_HOME_PLUGIN_DIR)
     
     # Add current directory for plugins if not explicitly included
-    if os.getcwd() not in plugin_paths:
-        plugin_paths.append(os.getcwd())
+    cwd = os.getcwd()
+    if cwd not in known_paths:
+        plugin_paths.append(cwd)
     
     if plugin_paths:
         try:
-            num_plugins = discover_plugins(plugin_paths)
+            num_plugins = discover_plugins(plugin_paths, use_cache=use_plugin_cache, command=command)
             if num_plugins > 0:
-                logger.info(f"Discovered {num_plugins} plugins from: {', '.join(plugin_paths)}")
+                logger.info("Discovered %d plugins from: %s", num_plugins, ", ".join(plugin_paths))
             else:
-                logger.debug(f"No plugins found in: {', '.join(plugin_paths)}")
+                logger.debug("No plugins found in: %s", plugin_paths)
         except Exception as e:
-            logger.error(f"Error discovering plugins: {e}")
+            logger.error("Error discovering plugins: %s", e)
     
+    if command is None:
+        _all_plugins_loaded = True
+    else:
+        _plugin_commands_loaded.add(command)
+    return config
+
+def _initialize_config_and_cache(profile=None):
+    """Load the config with profile active, apply its log level and set up the cache; returns the config."""
+    from .config import initialize_config
+    from .cache import initialize_cache
+
+    _configure_logging()
+
+    # Initialize configuration
+    config = initialize_config(profile=profile)
+    settings = config.get_settings({
+        "log_level": "INFO",
+        "cache_dir": ".quantum_cache",
+        "caching": True,
+        "cache_max_age": None,  # In seconds, None means no expiration
+    })
+    
+    # Set log level based on active profile
+    log_level = settings["log_level"]
+    numeric_level = _LOG_LEVELS.get(log_level.upper())
+    if isinstance(numeric_level, int):
+        logging.getLogger().setLevel(numeric_level)
+        logger.info("Set log level to %s", log_level)
+    
+    # Initialize cache with settings from config
+    cache_dir = settings["cache_dir"]
+    cache_enabled = settings["caching"]
+    max_age = settings["cache_max_age"]
+    
+    if cache_enabled:
+        initialize_cache(cache_dir, max_age)
+        logger.info("Cache initialized in %s with %s", cache_dir,
+                    f"{max_age}s expiration" if max_age else "no expiration")
+    else:
+        logger.info("Caching is disabled in the current profile")
     return config
 
 def setup_init_commands(subparsers):
     """Setup project initialization commands."""
     # Project initialization commands
-    init_parser = subparsers.add_parser("init", help="Initialize a new quantum project")
+    init_parser = subparsers.add_parser("init", help=_COMMAND_HELP["init"])
     init_subparsers = init_parser.add_subparsers(dest="init_cmd", help="Init command")
     
     # List available templates
@@ -138,7 +274,7 @@ def setup_init_commands(subparsers):
 
 def setup_security_commands(subparsers):
     """Setup security scanning commands."""
-    security_parser = subparsers.add_parser("security", help="Commands for security analysis")
+    security_parser = subparsers.add_parser("security", help=_COMMAND_HELP["security"])
     security_subparsers = security_parser.add_subparsers(dest="security_cmd", help="Security command", required=True)
 
     # security scan
@@ -149,7 +285,7 @@ def setup_security_commands(subparsers):
 
 def setup_ir_commands(subparsers):
     """Setup Intermediate Representation (IR) commands."""
-    ir_parser = subparsers.add_parser("ir", help="Commands for managing Intermediate Representation (IR)")
+    ir_parser = subparsers.add_parser("ir", help=_COMMAND_HELP["ir"])
     ir_subparsers = ir_parser.add_subparsers(dest="ir_cmd", help="IR command", required=True)
 
     # ir generate
@@ -171,24 +307,25 @@ def setup_ir_commands(subparsers):
     optimize_parser = ir_subparsers.add_parser("optimize", help="Optimize the quantum circuit IR")
     optimize_parser.add_argument("--input-file", '-i', required=False, help="Path to the input OpenQASM file")
     optimize_parser.add_argument("--output-file", '-o', default=None, help="Path to save the optimized OpenQASM file. Prints to stdout if not specified.")
-    optimize_parser.add_argument("--level", '-l', type=int, default=2, choices=[0, 1, 2, 3], help="Optimization level (0=None, 1=Light, 2=Medium, 3=Heavy)")
+    optimize_parser.add_argument("--level", '-l', type=int, default=2, choices=(0, 1, 2, 3), help="Optimization level (0=None, 1=Light, 2=Medium, 3=Heavy)")
     optimize_parser.add_argument("--target-depth", '-d', type=int, default=None, help="Target circuit depth (relevant for optimization level 3)")
-    optimize_parser.add_argument("--format", default='text', choices=['text', 'json'], help='Output format for statistics.')
+    optimize_parser.add_argument("--format", default='text', choices=_FORMAT_TEXT_JSON, help='Output format for statistics.')
 
     # ir mitigate
     mitigate_parser = ir_subparsers.add_parser("mitigate", help="Apply error mitigation techniques to the IR")
     mitigate_parser.add_argument("--input-file", '-i', required=True, help="Path to the input OpenQASM file (usually optimized)")
     mitigate_parser.add_argument("--output-file", '-o', required=True, help="Path to save the mitigated OpenQASM file")
-    mitigate_parser.add_argument("--technique", '-t', required=True, choices=ir_mitigate_mod.SUPPORTED_TECHNIQUES, help="Error mitigation technique to apply.")
-    mitigate_parser.add_argument("--params", '-p', default=None, help="JSON string containing technique-specific parameters (e.g., '{\"scale_factors\": [1, 2, 3]}')")
+    from .commands.ir._constants import SUPPORTED_TECHNIQUES
+    mitigate_parser.add_argument("--technique", '-t', required=True, choices=SUPPORTED_TECHNIQUES, help="Error mitigation technique to apply.")
+    mitigate_parser.add_argument("--params", '-p', type=_json_object, default=None, help="JSON string containing technique-specific parameters (e.g., '{\"scale_factors\": [1, 2, 3]}')")
     mitigate_parser.add_argument("--report", action='store_true', help="Generate a JSON report about the mitigation process.")
 
     # ir finetune
     finetune_parser = ir_subparsers.add_parser("finetune", help="Fine-tune circuit based on analysis results and hardware constraints")
     finetune_parser.add_argument("--input-file", '-i', nargs='?', default=None, help="Path to the input IR file (usually mitigated). If omitted, searches in ir/openqasm/mitigated/ and uses the first .qasm file found.")
     finetune_parser.add_argument("--output-file", '-o', default=None, help="Path to save fine-tuning results (JSON). If omitted, defaults to results/finetune/<input_stem>_finetune_results.json")
-    finetune_parser.add_argument("--hardware", choices=["ibm", "aws", "google"], default="ibm", help="Target hardware platform for fine-tuning")
-    finetune_parser.add_argument("--search", choices=["grid", "random"], default="random", help="Search method for hyperparameter optimization")
+    finetune_parser.add_argument("--hardware", choices=_PLATFORMS, default="ibm", help="Target hardware platform for fine-tuning")
+    finetune_parser.add_argument("--search", choices=("grid", "random"), default="random", help="Search method for hyperparameter optimization")
     finetune_parser.add_argument("--shots", type=int, default=1000, help="Number of shots for simulation during fine-tuning")
     finetune_parser.add_argument("--use-hardware", action="store_true", help="Execute circuits on actual quantum hardware instead of simulators")
     finetune_parser.add_argument("--device-id", help="Specific hardware device ID to use (e.g., 'ibmq_manila' for IBM)")
@@ -198,13 +335,13 @@ def setup_ir_commands(subparsers):
 
 def setup_run_commands(subparsers):
     """Setup commands for running circuits (simulation, hardware)."""
-    run_parser = subparsers.add_parser("run", help="Run quantum circuits on simulators or hardware")
+    run_parser = subparsers.add_parser("run", help=_COMMAND_HELP["run"])
     run_subparsers = run_parser.add_subparsers(dest="run_cmd", help="Run command", required=True)
 
     # run simulate
     simulate_parser = run_subparsers.add_parser("simulate", help="Run a circuit on a simulator")
     simulate_parser.add_argument("qasm_file", nargs='?', help="Path to the OpenQASM file to simulate (default: uses first .qasm file in ir/openqasm/base)")
-    simulate_parser.add_argument("--backend", choices=['qiskit', 'cirq', 'braket'], default='qiskit', help="Simulation backend to use (default: qiskit)")
+    simulate_parser.add_argument("--backend", choices=('qiskit', 'cirq', 'braket'), default='qiskit', help="Simulation backend to use (default: qiskit)")
     simulate_parser.add_argument("--output", help="Optional output file for simulation results (JSON)")
     simulate_parser.add_argument("--shots", type=int, default=1024, help="Number of simulation shots")
     # Add other simulation options later (e.g., --noise-model)
@@ -220,21 +357,21 @@ def setup_run_commands(subparsers):
 
 def setup_test_commands(subparsers):
     """Setup commands for testing quantum circuits."""
-    test_parser = subparsers.add_parser("test", help="Generate and run tests for quantum circuits")
+    test_parser = subparsers.add_parser("test", help=_COMMAND_HELP["test"])
     test_subparsers = test_parser.add_subparsers(dest="test_cmd", help="Test command", required=True)
 
     # test generate
     generate_parser = test_subparsers.add_parser("generate", help="Generate test code from an IR file using LLM")
     generate_parser.add_argument("--input-file", "-i", required=False, default=None, help="Path to the input mitigated IR file (e.g., .qasm). If omitted, searches in ir/openqasm/mitigated/ and uses the first file found.")
     generate_parser.add_argument("--output-dir", "-o", default="tests/generated", help="Directory to save the generated Python test files (default: tests/generated)")
-    generate_parser.add_argument("--llm-provider", default="google", choices=["togetherai", "google"], help="LLM provider to use for test generation (default: togetherai)")
+    generate_parser.add_argument("--llm-provider", default="google", choices=("togetherai", "google"), help="LLM provider to use for test generation (default: togetherai)")
     generate_parser.add_argument("--llm-model", help="Specific LLM model name (e.g., 'mistralai/Mixtral-8x7B-Instruct-v0.1' for togetherai, 'gemini-1.5-pro-latest' for google)")
 
     # test run - implemented based on existing test function
     run_parser = test_subparsers.add_parser("run", help="Run generated test file(s)")
     run_parser.add_argument("test_file", nargs='?', default=None, help="Path to the test file or directory containing tests. If omitted, searches in tests/generated/ and runs the first .py file found.")
     run_parser.add_argument("--output", help="Path to save test results (JSON)")
-    run_parser.add_argument("--simulator", choices=["qiskit", "cirq", "braket", "all"], default="qiskit", 
+    run_parser.add_argument("--simulator", choices=("qiskit", "cirq", "braket", "all"), default="qiskit", 
                            help="Simulator to use for running tests (applicable if test_file is a circuit file)")
     run_parser.add_argument("--shots", type=int, default=1024, 
                            help="Number of shots for simulation (applicable if test_file is a circuit file)")
@@ -242,52 +379,57 @@ def setup_test_commands(subparsers):
 
 def setup_analyze_commands(subparsers):
     """Setup commands for circuit analysis."""
-    analyze_parser = subparsers.add_parser("analyze", help="Analyze quantum circuit properties")
+    analyze_parser = subparsers.add_parser("analyze", help=_COMMAND_HELP["analyze"])
     analyze_subparsers = analyze_parser.add_subparsers(dest="analyze_cmd", help="Analysis command", required=True)
 
     # analyze resources
     resources_parser = analyze_subparsers.add_parser("resources", help="Estimate resource requirements (qubits, gates)")
     resources_parser.add_argument("ir_file", nargs='?', default=None, help="Path to the input IR file (OpenQASM). If omitted, searches in ir/openqasm/mitigated/ and uses the first .qasm file found.")
     resources_parser.add_argument("--output", default=None, help="Path to save resource estimation results (JSON). If omitted, defaults to results/analysis/resources/<ir_stem>_resources.json")
-    resources_parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format")
+    resources_parser.add_argument("--format", choices=_FORMAT_TEXT_JSON, default="text", help="Output format")
 
     # analyze cost 
     cost_parser = analyze_subparsers.add_parser("cost", help="Estimate execution cost on different platforms")
     cost_parser.add_argument("ir_file", nargs='?', default=None, help="Path to the input IR file (OpenQASM). If omitted, searches in ir/openqasm/mitigated/ and uses the first .qasm file found.")
     cost_parser.add_argument("--resource-file", help="Path to resource estimation file (optional input)")
     cost_parser.add_argument("--output", default=None, help="Path to save cost estimation results (JSON). If omitted, defaults to results/analysis/cost/<ir_stem>_cost.json")
-    cost_parser.add_argument("--platform", choices=["all", "ibm", "aws", "google"], default="all", 
+    cost_parser.add_argument("--platform", choices=_PLATFORMS_ALL, default="all", 
                            help="Target platform for cost estimation")
     cost_parser.add_argument("--shots", type=int, default=1000, help="Number of shots for execution")
-    cost_parser.add_argument("--format", choices=["text", "json"], default="text", help="Output format")
+    cost_parser.add_argument("--format", choices=_FORMAT_TEXT_JSON, default="text", help="Output format")
 
     # analyze benchmark
     benchmark_parser = analyze_subparsers.add_parser("benchmark", help="Benchmark circuit performance")
     benchmark_parser.add_argument("ir_file", nargs='?', default=None, help="Path to the input IR file (OpenQASM). If omitted, searches in ir/openqasm/mitigated/ and uses the first .qasm file found.")
     benchmark_parser.add_argument("--output", default=None, help="Path to save benchmark results (JSON). If omitted, defaults to results/analysis/benchmark/<ir_stem>_benchmark.json")
-    benchmark_parser.set_defaults(func=lambda args: analyze_benchmark_mod.benchmark(args.ir_file, args.output))
+    benchmark_parser.set_defaults(func=_run_benchmark)
+
+def _run_benchmark(args):
+    """Run the benchmark command for parsed arguments."""
+    from .commands import benchmark as analyze_benchmark_mod
+    return analyze_benchmark_mod.benchmark(args.ir_file, args.output)
 
 def setup_visualization_commands(subparsers):
     """Setup visualization commands."""
-    vis_parser = subparsers.add_parser("visualize", help="Visualize circuits or results")
+    vis_parser = subparsers.add_parser("visualize", help=_COMMAND_HELP["visualize"])
     vis_subparsers = vis_parser.add_subparsers(dest="visualize_cmd", help="Visualization command", required=True)
 
     # visualize circuit
     vis_circuit_parser = vis_subparsers.add_parser("circuit", help="Visualize a quantum circuit")
     vis_circuit_parser.add_argument("--source", required=True, help="Path to the circuit file (QASM or other supported format)")
     vis_circuit_parser.add_argument("--output", help="Output file path (e.g., .png, .txt, .html)")
-    vis_circuit_parser.add_argument("--format", choices=["text", "mpl", "latex", "html"], default="mpl", help="Output format")
+    vis_circuit_parser.add_argument("--format", choices=("text", "mpl", "latex", "html"), default="mpl", help="Output format")
 
     # visualize results
     vis_results_parser = vis_subparsers.add_parser("results", help="Visualize simulation or hardware results")
     vis_results_parser.add_argument("--source", required=True, help="Path to the results file (JSON)")
     vis_results_parser.add_argument("--output", help="Output file path (e.g., .png)")
-    vis_results_parser.add_argument("--type", choices=["histogram", "statevector", "hinton", "qsphere"], default="histogram", help="Type of plot")
+    vis_results_parser.add_argument("--type", choices=("histogram", "statevector", "hinton", "qsphere"), default="histogram", help="Type of plot")
     vis_results_parser.add_argument("--interactive", action="store_true", help="Show interactive plot")
 
 def setup_service_commands(subparsers):
     """Setup commands for microservice management."""
-    service_parser = subparsers.add_parser("service", help="Generate and test microservice wrappers")
+    service_parser = subparsers.add_parser("service", help=_COMMAND_HELP["service"])
     service_subparsers = service_parser.add_subparsers(dest="service_cmd", help="Service command", required=True)
 
     # service generate
@@ -320,14 +462,14 @@ def setup_service_commands(subparsers):
 
 def setup_package_commands(subparsers):
     """Setup commands for application packaging."""
-    package_parser = subparsers.add_parser("package", help="Package quantum applications")
+    package_parser = subparsers.add_parser("package", help=_COMMAND_HELP["package"])
     package_subparsers = package_parser.add_subparsers(dest="package_cmd", help="Package command", required=True)
 
     # package create
     create_parser = package_subparsers.add_parser("create", help="Create a distributable application package")
     create_parser.add_argument("--source-dir", required=True, help="Path to the source directory")
     create_parser.add_argument("--output-path", help="Path to save the output package (e.g., .zip file)")
-    create_parser.add_argument("--format", choices=["zip", "tar", "wheel"], default="zip", help="Package format (default: zip)")
+    create_parser.add_argument("--format", choices=("zip", "tar", "wheel"), default="zip", help="Package format (default: zip)")
     create_parser.add_argument("--config", help="Path to package configuration file")
     create_parser.add_argument("--app-name", help="Application name (overrides config)")
     create_parser.add_argument("--version", help="Package version (overrides config)")
@@ -341,7 +483,7 @@ def setup_package_commands(subparsers):
     # package info
     info_parser = package_subparsers.add_parser("info", help="Show information about a package")
     info_parser.add_argument("package_path", help="Path to the package file")
-    info_parser.add_argument("--format", choices=["text", "json", "yaml"], default="text", help="Output format")
+    info_parser.add_argument("--format", choices=("text", "json", "yaml"), default="text", help="Output format")
 
     # package extract
     extract_parser = package_subparsers.add_parser("extract", help="Extract a package to a directory")
@@ -351,7 +493,7 @@ def setup_package_commands(subparsers):
 
 def setup_hub_commands(subparsers):
     """Setup commands for Quantum Hub interaction."""
-    hub_parser = subparsers.add_parser("hub", help="Interact with the Quantum Hub")
+    hub_parser = subparsers.add_parser("hub", help=_COMMAND_HELP["hub"])
     hub_subparsers = hub_parser.add_subparsers(dest="hub_cmd", help="Hub command")
 
     # hub publish (placeholder)
@@ -361,79 +503,81 @@ def setup_hub_commands(subparsers):
     # publish_parser.add_argument("--token", help="Quantum Hub API token (or use env var/config)")
     # Add other metadata flags if needed (e.g., --description, --tags)
 
+def _storage_path_parent(help_text):
+    """Parent parser holding a single --storage-path option, for parents=[...]."""
+    parent = _PicklableArgumentParser(add_help=False)
+    parent.add_argument("--storage-path", help=help_text)
+    return parent
+
 def setup_job_commands(subparsers):
     """Setup job management commands."""
     # Job management commands
-    jobs_parser = subparsers.add_parser("jobs", help="Manage quantum execution jobs")
+    jobs_parser = subparsers.add_parser("jobs", help=_COMMAND_HELP["jobs"])
     jobs_subparsers = jobs_parser.add_subparsers(dest="jobs_cmd", help="Jobs command")
+    # Every jobs subcommand takes --storage-path; add it once and share the action
+    storage_parent = _storage_path_parent("Jobs storage path")
     
     # List jobs
-    list_parser = jobs_subparsers.add_parser("list", help="List jobs")
+    list_parser = jobs_subparsers.add_parser("list", help="List jobs", parents=[storage_parent])
     list_parser.add_argument("--status", help="Filter by status (comma-separated)")
     list_parser.add_argument("--provider", help="Filter by provider")
     list_parser.add_argument("--backend", help="Filter by backend")
     list_parser.add_argument("--days", type=int, default=7, help="Show jobs from the last N days")
-    list_parser.add_argument("--storage-path", help="Jobs storage path", default=config_manager.get_default_param("jobs", "storage_path"))
     
     # Get job details
-    get_parser = jobs_subparsers.add_parser("get", help="Get job details")
+    get_parser = jobs_subparsers.add_parser("get", help="Get job details", parents=[storage_parent])
     get_parser.add_argument("job_id", help="Job ID")
-    get_parser.add_argument("--storage-path", help="Jobs storage path", default=config_manager.get_default_param("jobs", "storage_path"))
     
     # Get job results
-    results_parser = jobs_subparsers.add_parser("results", help="Get job results")
+    results_parser = jobs_subparsers.add_parser("results", help="Get job results", parents=[storage_parent])
     results_parser.add_argument("job_id", help="Job ID")
     results_parser.add_argument("--output-file", help="Output file path")
-    results_parser.add_argument("--output-format", help="Output format", choices=["text", "json", "csv"], default="text")
-    results_parser.add_argument("--storage-path", help="Jobs storage path", default=config_manager.get_default_param("jobs", "storage_path"))
+    results_parser.add_argument("--output-format", help="Output format", choices=_OUTPUT_FMT_CSV, default="text")
     
     # Cancel job
-    cancel_parser = jobs_subparsers.add_parser("cancel", help="Cancel a job")
+    cancel_parser = jobs_subparsers.add_parser("cancel", help="Cancel a job", parents=[storage_parent])
     cancel_parser.add_argument("job_id", help="Job ID")
-    cancel_parser.add_argument("--storage-path", help="Jobs storage path", default=config_manager.get_default_param("jobs", "storage_path"))
     
     # Monitor jobs
-    monitor_parser = jobs_subparsers.add_parser("monitor", help="Monitor jobs")
+    monitor_parser = jobs_subparsers.add_parser("monitor", help="Monitor jobs", parents=[storage_parent])
     monitor_parser.add_argument("--job-id", help="Specific job ID to monitor")
     monitor_parser.add_argument("--status", help="Filter by status (comma-separated)")
-    monitor_parser.add_argument("--interval", type=int, help="Update interval in seconds", 
-                               default=config_manager.get_default_param("jobs", "monitor_interval"))
-    monitor_parser.add_argument("--storage-path", help="Jobs storage path", default=config_manager.get_default_param("jobs", "storage_path"))
+    monitor_parser.add_argument("--interval", type=int, help="Update interval in seconds")
 
 
 def setup_versioning_commands(subparsers):
     """Setup versioning-related commands."""
     # Versioning commands
-    version_parser = subparsers.add_parser("version", help="Manage quantum circuit versions")
+    version_parser = subparsers.add_parser("version", help=_COMMAND_HELP["version"])
     version_subparsers = version_parser.add_subparsers(dest="version_cmd", help="Version command")
     
     # Initialize repository
     init_parser = version_subparsers.add_parser("init", help="Initialize a version control repository")
-    init_parser.add_argument("--repo-path", help="Path to repository", default=config_manager.get_default_param("version", "repo_path"))
+    init_parser.add_argument("--repo-path", help="Path to repository")
     
     # Commit circuit version
     commit_parser = version_subparsers.add_parser("commit", help="Commit a new circuit version")
-    commit_parser.add_argument("--repo-path", help="Path to repository", default=config_manager.get_default_param("version", "repo_path"))
-    commit_parser.add_argument("--author", help="Author name", default=config_manager.get_config_value("user.name"))
+    commit_parser.add_argument("--repo-path", help="Path to repository")
+    commit_parser.add_argument("--author", help="Author name")
     commit_parser.add_argument("--circuit-name", required=True, help="Name of the circuit")
     commit_parser.add_argument("--circuit-file", required=True, help="Path to circuit file")
     commit_parser.add_argument("--message", required=True, help="Commit message")
     
     # Get specific version
     get_parser = version_subparsers.add_parser("get", help="Get a specific circuit version")
-    get_parser.add_argument("--repo-path", help="Path to repository", default=config_manager.get_default_param("version", "repo_path"))
+    get_parser.add_argument("--repo-path", help="Path to repository")
     get_parser.add_argument("--circuit-name", required=True, help="Name of the circuit")
     get_parser.add_argument("--version-id", required=True, help="Version ID")
     get_parser.add_argument("--output-file", help="Output file path")
     
     # List versions
     list_parser = version_subparsers.add_parser("list", help="List circuit versions")
-    list_parser.add_argument("--repo-path", help="Path to repository", default=config_manager.get_default_param("version", "repo_path"))
+    list_parser.add_argument("--repo-path", help="Path to repository")
     list_parser.add_argument("--circuit-name", help="Name of the circuit")
     
     # Checkout version
     checkout_parser = version_subparsers.add_parser("checkout", help="Checkout a specific circuit version")
-    checkout_parser.add_argument("--repo-path", help="Path to repository", default=config_manager.get_default_param("version", "repo_path"))
+    checkout_parser.add_argument("--repo-path", help="Path to repository")
     checkout_parser.add_argument("--circuit-name", required=True, help="Name of the circuit")
     checkout_parser.add_argument("--version-id", required=True, help="Version ID")
     checkout_parser.add_argument("--output-file", help="Output file path")
@@ -441,13 +585,13 @@ def setup_versioning_commands(subparsers):
 def setup_marketplace_commands(subparsers):
     """Setup marketplace-related commands."""
     # Marketplace commands
-    marketplace_parser = subparsers.add_parser("marketplace", help="Quantum algorithm marketplace")
+    marketplace_parser = subparsers.add_parser("marketplace", help=_COMMAND_HELP["marketplace"])
     marketplace_subparsers = marketplace_parser.add_subparsers(dest="marketplace_cmd", help="Marketplace command")
     
     # Browse algorithms
     browse_parser = marketplace_subparsers.add_parser("browse", help="Browse available algorithms")
     browse_parser.add_argument("--tag", help="Filter by tag")
-    browse_parser.add_argument("--sort-by", help="Sort by field", default=config_manager.get_default_param("marketplace", "sort_by"))
+    browse_parser.add_argument("--sort-by", help="Sort by field")
     
     # Search algorithms
     search_parser = marketplace_subparsers.add_parser("search", help="Search for algorithms")
@@ -475,7 +619,7 @@ def setup_marketplace_commands(subparsers):
     # Submit review
     review_parser = marketplace_subparsers.add_parser("review", help="Submit a review")
     review_parser.add_argument("algorithm_id", help="Algorithm ID")
-    review_parser.add_argument("--rating", required=True, type=int, choices=range(1, 6), help="Rating (1-5)")
+    review_parser.add_argument("--rating", required=True, type=int, choices=_RATING_CHOICES, help="Rating (1-5)")
     review_parser.add_argument("--comment", help="Review comment")
     
     # Configure marketplace
@@ -486,68 +630,60 @@ def setup_marketplace_commands(subparsers):
 def setup_sharing_commands(subparsers):
     """Setup sharing-related commands."""
     # Sharing commands
-    sharing_parser = subparsers.add_parser("share", help="Share quantum circuits")
+    sharing_parser = subparsers.add_parser("share", help=_COMMAND_HELP["share"])
     sharing_subparsers = sharing_parser.add_subparsers(dest="sharing_cmd", help="Sharing command")
+    storage_parent = _storage_path_parent("Storage path")
     
     # Share circuit
-    circuit_parser = sharing_subparsers.add_parser("circuit", help="Share a circuit")
-    circuit_parser.add_argument("--repo-path", help="Path to repository", default=config_manager.get_default_param("version", "repo_path"))
+    circuit_parser = sharing_subparsers.add_parser("circuit", help="Share a circuit", parents=[storage_parent])
+    circuit_parser.add_argument("--repo-path", help="Path to repository")
     circuit_parser.add_argument("--circuit-name", required=True, help="Name of the circuit")
     circuit_parser.add_argument("--version-id", help="Version ID (latest if not specified)")
     circuit_parser.add_argument("--description", help="Description")
-    circuit_parser.add_argument("--storage-path", help="Storage path", default=config_manager.get_default_param("share", "storage_path"))
     circuit_parser.add_argument("--recipients", required=True, help="Recipients (comma-separated emails)")
-    circuit_parser.add_argument("--permission", help="Permission level", choices=["read_only", "read_write", "admin"], default=config_manager.get_default_param("share", "permission"))
+    circuit_parser.add_argument("--permission", help="Permission level", choices=_PERMISSIONS)
     circuit_parser.add_argument("--tags", help="Tags (comma-separated)")
     
     # List shared circuits
-    list_parser = sharing_subparsers.add_parser("list", help="List shared circuits")
+    list_parser = sharing_subparsers.add_parser("list", help="List shared circuits", parents=[storage_parent])
     list_parser.add_argument("--shared-by-me", action="store_true", help="List circuits shared by me")
     list_parser.add_argument("--shared-with-me", action="store_true", help="List circuits shared with me")
-    list_parser.add_argument("--storage-path", help="Storage path", default=config_manager.get_default_param("share", "storage_path"))
     
     # Get shared circuit
-    get_parser = sharing_subparsers.add_parser("get", help="Get a shared circuit")
+    get_parser = sharing_subparsers.add_parser("get", help="Get a shared circuit", parents=[storage_parent])
     get_parser.add_argument("--share-id", required=True, help="Share ID")
     get_parser.add_argument("--output-file", help="Output file path")
-    get_parser.add_argument("--storage-path", help="Storage path", default=config_manager.get_default_param("share", "storage_path"))
     
     # Update permissions
-    permissions_parser = sharing_subparsers.add_parser("permissions", help="Update permissions")
+    permissions_parser = sharing_subparsers.add_parser("permissions", help="Update permissions", parents=[storage_parent])
     permissions_parser.add_argument("--share-id", required=True, help="Share ID")
     permissions_parser.add_argument("--collaborator", required=True, help="Collaborator email")
-    permissions_parser.add_argument("--permission", required=True, help="Permission level", choices=["read_only", "read_write", "admin"])
-    permissions_parser.add_argument("--storage-path", help="Storage path", default=config_manager.get_default_param("share", "storage_path"))
+    permissions_parser.add_argument("--permission", required=True, help="Permission level", choices=_PERMISSIONS)
     
     # Remove collaborator
-    remove_collaborator_parser = sharing_subparsers.add_parser("remove-collaborator", help="Remove a collaborator")
+    remove_collaborator_parser = sharing_subparsers.add_parser("remove-collaborator", help="Remove a collaborator", parents=[storage_parent])
     remove_collaborator_parser.add_argument("--share-id", required=True, help="Share ID")
     remove_collaborator_parser.add_argument("--collaborator", required=True, help="Collaborator email")
-    remove_collaborator_parser.add_argument("--storage-path", help="Storage path", default=config_manager.get_default_param("share", "storage_path"))
     
     # Unshare circuit
-    unshare_parser = sharing_subparsers.add_parser("unshare", help="Unshare a circuit")
+    unshare_parser = sharing_subparsers.add_parser("unshare", help="Unshare a circuit", parents=[storage_parent])
     unshare_parser.add_argument("--share-id", required=True, help="Share ID")
-    unshare_parser.add_argument("--storage-path", help="Storage path", default=config_manager.get_default_param("share", "storage_path"))
     
     # Get activity history
-    activity_parser = sharing_subparsers.add_parser("activity", help="Get activity history")
+    activity_parser = sharing_subparsers.add_parser("activity", help="Get activity history", parents=[storage_parent])
     activity_parser.add_argument("--share-id", required=True, help="Share ID")
-    activity_parser.add_argument("--storage-path", help="Storage path", default=config_manager.get_default_param("share", "storage_path"))
     
     # Search shared circuits
-    search_parser = sharing_subparsers.add_parser("search", help="Search shared circuits")
+    search_parser = sharing_subparsers.add_parser("search", help="Search shared circuits", parents=[storage_parent])
     search_parser.add_argument("query", help="Search query")
-    search_parser.add_argument("--storage-path", help="Storage path", default=config_manager.get_default_param("share", "storage_path"))
 
 def setup_compare_commands(subparsers):
     """Setup circuit comparison commands."""
     # Circuit comparison commands
-    compare_parser = subparsers.add_parser("compare", help="Compare quantum circuits")
+    compare_parser = subparsers.add_parser("compare", help=_COMMAND_HELP["compare"])
     compare_parser.add_argument("--circuit1", required=True, help="Path to first circuit file")
     compare_parser.add_argument("--circuit2", required=True, help="Path to second circuit file")
-    compare_parser.add_argument("--output-format", help="Output format", choices=["text", "json", "markdown"], 
-                               default=config_manager.get_default_param("compare", "output_format"))
+    compare_parser.add_argument("--output-format", help="Output format", choices=_FORMAT_TEXT_JSON_MD)
     compare_parser.add_argument("--output-file", help="Output file path")
     compare_parser.add_argument("--detailed", action="store_true", help="Show detailed comparison")
     compare_parser.add_argument("--metrics", help="Specific metrics to compare (comma-separated)")
@@ -556,14 +692,13 @@ def setup_compare_commands(subparsers):
 def setup_hardware_commands(subparsers):
     """Setup hardware selection commands."""
     # Hardware selection commands
-    hardware_parser = subparsers.add_parser("find-hardware", help="Find suitable quantum hardware")
+    hardware_parser = subparsers.add_parser("find-hardware", help=_COMMAND_HELP["find-hardware"])
     hardware_parser.add_argument("--circuit", required=True, help="Path to circuit file")
-    hardware_parser.add_argument("--criteria", help="Selection criteria", choices=["overall", "performance", "cost", "availability"],
-                                default=config_manager.get_default_param("find-hardware", "criteria"))
+    hardware_parser.add_argument("--criteria", help="Selection criteria", choices=("overall", "performance", "cost", "availability"))
     hardware_parser.add_argument("--provider", help="Filter by provider (comma-separated)")
     hardware_parser.add_argument("--min-qubits", type=int, help="Minimum number of qubits")
     hardware_parser.add_argument("--max-cost", type=float, help="Maximum cost")
-    hardware_parser.add_argument("--output-format", help="Output format", choices=["text", "json", "markdown"], default="text")
+    hardware_parser.add_argument("--output-format", help="Output format", choices=_FORMAT_TEXT_JSON_MD, default="text")
     hardware_parser.add_argument("--output-file", help="Output file path")
     hardware_parser.add_argument("--top", type=int, default=3, help="Number of recommendations to show")
     hardware_parser.add_argument("--update-catalog", action="store_true", help="Update hardware catalog before searching")
@@ -572,7 +707,7 @@ def setup_hardware_commands(subparsers):
 def setup_config_commands(subparsers):
     """Setup configuration commands."""
     # Configuration commands
-    config_parser = subparsers.add_parser("config", help="Manage configuration and default parameters")
+    config_parser = subparsers.add_parser("config", help=_COMMAND_HELP["config"])
     config_subparsers = config_parser.add_subparsers(dest="config_cmd", help="Configuration command")
     
     # Get config value
@@ -622,7 +757,7 @@ def setup_config_commands(subparsers):
 def setup_dependency_commands(subparsers):
     """Setup dependency analysis commands."""
     # Dependency analysis commands
-    deps_parser = subparsers.add_parser("deps", help="Analyze dependencies")
+    deps_parser = subparsers.add_parser("deps", help=_COMMAND_HELP["deps"])
     deps_subparsers = deps_parser.add_subparsers(dest="deps_cmd", help="Dependency command")
     
     # Check dependencies
@@ -632,7 +767,7 @@ def setup_dependency_commands(subparsers):
     # Generate dependency report
     report_parser = deps_subparsers.add_parser("report", help="Generate dependency report")
     report_parser.add_argument("--output", "-o", required=True, help="Output file path")
-    report_parser.add_argument("--format", "-f", choices=["text", "json", "markdown"], default="text", help="Report format")
+    report_parser.add_argument("--format", "-f", choices=_FORMAT_TEXT_JSON_MD, default="text", help="Report format")
     report_parser.add_argument("--requirements", "-r", help="Path to requirements file")
     
     # Get install command
@@ -648,7 +783,7 @@ def setup_dependency_commands(subparsers):
 
 def setup_template_commands(subparsers):
     """Setup template management commands (Placeholder)."""
-    template_parser = subparsers.add_parser("template", help="Manage circuit templates (Placeholder)")
+    template_parser = subparsers.add_parser("template", help=_COMMAND_HELP["template"])
     template_subparsers = template_parser.add_subparsers(dest="template_cmd", help="Template command")
 
     # Placeholder subcommands (can be uncommented/implemented later)
@@ -659,177 +794,436 @@ def setup_template_commands(subparsers):
 
 
 
-def main():
-    """Main entry point for the Quantum CLI SDK."""
-    config = initialize_sdk()
-
-    parser = argparse.ArgumentParser(description="Quantum CLI SDK")
-    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+# Command name -> parser setup function, in top-level help order
+_SUBCMD_SETUP = {
+    # Command groups based on pipeline stages
+    "ir": setup_ir_commands,
+    "run": setup_run_commands,
+    "analyze": setup_analyze_commands,
+    "test": setup_test_commands,
+    "service": setup_service_commands,
+    "package": setup_package_commands,
+    "hub": setup_hub_commands,
+    # Other command groups
+    "init": setup_init_commands,
+    "compare": setup_compare_commands,
+    "config": setup_config_commands,
+    "deps": setup_dependency_commands,
+    "find-hardware": setup_hardware_commands,
+    "jobs": setup_job_commands,
+    "marketplace": setup_marketplace_commands,
+    "share": setup_sharing_commands,
+    "template": setup_template_commands,
+    "version": setup_versioning_commands,
+    "visualize": setup_visualization_commands,
+    "security": setup_security_commands,
+}
+
+def _add_global_arguments(parser):
+    """Add the options accepted before the command name."""
     # Global argument for profile selection
     parser.add_argument("--profile", help="Specify configuration profile to use", default="default")
+    parser.add_argument("--no-plugin-cache", action="store_true", help="Rescan plugin directories instead of using the plugin cache")
+
+def _preparse_args(argv):
+    """Find the global options and command name; the rest is left for the full parser.
+
+    This runs on every invocation, so it scans argv by hand instead of
+    building a parser. It accepts what the full parser accepts before the
+    command (including unambiguous --profile/--no-plugin-cache prefixes);
+    anything malformed is left in rest for the full parser to report.
+    """
+    pre_args = argparse.Namespace(profile="default", no_plugin_cache=False, command=None)
+    rest = []
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        name, eq, value = arg.partition("=")
+        if len(name) > 2 and "--profile".startswith(name):
+            if eq:
+                pre_args.profile = value
+            elif i + 1 < len(argv):
+                i += 1
+                pre_args.profile = argv[i]
+            else:
+                rest.append(arg)
+        elif len(arg) > 2 and "--no-plugin-cache".startswith(arg):
+            pre_args.no_plugin_cache = True
+        elif arg == "-h" or (len(arg) > 2 and ("--help".startswith(arg) or "--version".startswith(arg))):
+            # Top-level help/version wins over a later command name, so leave
+            # the command unset and let the full parser list every command
+            rest.extend(argv[i:])
+            break
+        elif arg.startswith("-"):
+            rest.append(arg)
+        else:
+            # Everything after the command belongs to the command's own parser
+            pre_args.command = arg
+            rest.extend(argv[i + 1:])
+            break
+        i += 1
+    return pre_args, rest
+
+def _needs_sdk(command, rest):
+    """Return False for meta invocations that don't need config, cache or plugins."""
+    if command is None:
+        # Top-level --help/--version or no command at all
+        return False
+    if command in _SUBCMD_SETUP and ("-h" in rest or "--help" in rest):
+        return False
+    return command not in _SDK_FREE_COMMANDS
+
+def _identity(value):
+    return value
+
+class _PicklableArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser (and subparsers) without the local closure argparse registers."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.register('type', None, _identity)
+
+def _build_parser(command):
+    """Build the argument parser, with full arguments only for the given command."""
+    from .plugin_system import setup_plugin_subparsers
+
+    parser = _PicklableArgumentParser(
+        description="Quantum CLI SDK",
+        epilog="Set QUANTUM_SKIP_PLUGINS=1 to skip plugin discovery, e.g. in CI or scripts.")
+    parser.add_argument("--version", action="version", version=f"%(prog)s {__version__}")
+    _add_global_arguments(parser)
 
     subparsers = parser.add_subparsers(dest="command", help="Available commands")
 
-    # Setup command groups based on pipeline stages
-    setup_ir_commands(subparsers)
-    setup_run_commands(subparsers)      # Includes simulate
-    setup_analyze_commands(subparsers)  # Placeholders commented
-    setup_test_commands(subparsers)     # Uncommented
-    setup_service_commands(subparsers)  # Placeholders commented
-    setup_package_commands(subparsers)  # Placeholders commented
-    setup_hub_commands(subparsers)      # Placeholders commented
-
-    # Setup other command groups
-    setup_init_commands(subparsers)
-    setup_compare_commands(subparsers)
-    setup_config_commands(subparsers)
-    setup_dependency_commands(subparsers)
-    setup_hardware_commands(subparsers) # Keeping for now, maybe integrate into run/analyze?
-    setup_job_commands(subparsers)
-    setup_marketplace_commands(subparsers)
-    setup_sharing_commands(subparsers)
-    setup_template_commands(subparsers)
-    setup_versioning_commands(subparsers)
-    setup_visualization_commands(subparsers)
-    setup_security_commands(subparsers)
+    # Only build the subparser for the requested command. For --help,
+    # --version and unknown/plugin commands, register the built-in commands
+    # by name so they are still listed without building their arguments.
+    # The stubs never parse anything (a built-in name on the command line
+    # takes the branch above), so they don't need their own -h action.
+    setup_func = _SUBCMD_SETUP.get(command)
+    if setup_func is not None:
+        setup_func(subparsers)
+    else:
+        for name, help_text in _COMMAND_HELP.items():
+            subparsers.add_parser(name, help=help_text, add_help=False)
 
     # Setup interactive mode command
     interactive_parser = subparsers.add_parser("interactive", help="Start interactive shell")
 
     # Discover and setup plugin commands
     setup_plugin_subparsers(subparsers)
-
-    # Parse arguments
-    if len(sys.argv) <= 1:
-        # If no command is provided, print help and exit
-        parser.print_help(sys.stderr)
-        sys.exit(1)
-
-    args = parser.parse_args()
-
-    # Load the specified profile
-    if args.profile != "default":
-         try:
-             config_manager.switch_profile(args.profile)
-             logger.info(f"Switched to profile: {args.profile}")
-             # Re-initialize components based on new profile settings if necessary
-             config = initialize_sdk() 
-         except ValueError as e:
-             print(f"Error switching profile: {e}", file=sys.stderr)
-             sys.exit(1)
+    return parser
+
+def _resolved_profile(profile="default"):
+    """The profile the config will activate: --profile, else QUANTUM_PROFILE, else "default"."""
+    if profile != "default":
+        return profile
+    return os.environ.get("QUANTUM_PROFILE") or "default"
+
+def _config_source_files(profile):
+    """Every file the config and default parameters can be read from for profile."""
+    home = os.path.expanduser("~")
+    paths = [_DEFAULTS_CONFIG_FILE,
+             os.path.join(os.path.dirname(_DEFAULTS_CONFIG_FILE), "profiles", f"{profile}.json")]
+    env_config = os.environ.get("QUANTUM_CONFIG")
+    if env_config:
+        paths.append(os.path.abspath(env_config))
+    # Project-level config in the working directory, then the one in the home directory
+    for ext in _CONFIG_FILE_EXTS:
+        paths.append(os.path.abspath(f"quantum_config{ext}"))
+    for ext in _CONFIG_FILE_EXTS:
+        paths.append(os.path.join(home, f".quantum_config{ext}"))
+    return paths
+
+def _parser_cache_key(command, profile):
+    """Key a cached parser on everything its construction depends on."""
+    stamps = [__version__, command, os.path.basename(sys.argv[0]), profile]
+    # cli.py defines the parsers; config defaults are applied after parsing,
+    # but the config files are stamped too so a cached parser never outlives them
+    for path in (__file__, *_config_source_files(profile)):
+        try:
+            st = os.stat(path)
+        except OSError:
+            stamps.append((path, None))
+        else:
+            stamps.append((path, st.st_mtime_ns, st.st_size))
+    return repr(stamps)
+
+def _parser_cache_file(command):
+    """Path of the pickled parser for command (None is the top-level parser)."""
+    return os.path.join(_PARSER_CACHE_DIR, f"{command or '_top'}.pkl")
+
+def _load_cached_parser(command, profile):
+    """Return the pickled parser for command if it is still current, else None."""
+    try:
+        with open(_parser_cache_file(command), "rb") as f:
+            key, parser = pickle.load(f)
+    except Exception:
+        return None
+    if key != _parser_cache_key(command, profile):
+        return None
+    _restore_suppress(parser)
+    return parser
+
+def _restore_suppress(parser):
+    """Re-link unpickled argparse.SUPPRESS copies; argparse compares it by identity."""
+    for action in parser._actions:
+        for attr in ("dest", "default", "help"):
+            if getattr(action, attr) == argparse.SUPPRESS:
+                setattr(action, attr, argparse.SUPPRESS)
+        if isinstance(action, argparse._SubParsersAction):
+            for subparser in action.choices.values():
+                _restore_suppress(subparser)
+
+def _write_cache_file(path, value):
+    """Pickle value to path atomically, so concurrent runs never read a partial file."""
+    os.makedirs(_PARSER_CACHE_DIR, exist_ok=True)
+    data = pickle.dumps(value)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+def _save_cached_parser(command, profile, parser):
+    """Pickle the parser for command so later runs can skip building it."""
+    try:
+        _write_cache_file(_parser_cache_file(command), (_parser_cache_key(command, profile), parser))
+    except Exception as e:
+        logger.debug("Could not write parser cache: %s", e)
+
+def _help_cache_key(profile):
+    """Top-level help depends on the parser and the terminal width argparse wraps to."""
+    return (_parser_cache_key(None, profile), shutil.get_terminal_size().columns)
+
+def _load_cached_help(profile):
+    """Return the formatted top-level help if it is still current, else None."""
+    try:
+        with open(os.path.join(_PARSER_CACHE_DIR, "_help.pkl"), "rb") as f:
+            key, help_text = pickle.load(f)
+    except Exception:
+        return None
+    return help_text if key == _help_cache_key(profile) else None
+
+def _save_cached_help(profile, help_text):
+    """Store the formatted top-level help so later --help runs skip the parser."""
+    try:
+        _write_cache_file(os.path.join(_PARSER_CACHE_DIR, "_help.pkl"), (_help_cache_key(profile), help_text))
+    except Exception as e:
+        logger.debug("Could not write help cache: %s", e)
+
+def _print_version():
+    """Print the version like the parser's version action would, without building the parser."""
+    print(f"{os.path.basename(sys.argv[0])} {__version__}")
+    return 0
+
+def _print_top_help(help_text, no_args):
+    """Print top-level help and return the exit code; with no command at all it is a usage error."""
+    if no_args:
+        sys.stderr.write(help_text)
+        return 1
+    sys.stdout.write(help_text)
+    return 0
+
+def _disable_argparse_gettext():
+    """Skip gettext catalog lookups in argparse; all CLI strings are English literals."""
+    argparse._ = lambda message: message
+    argparse.ngettext = lambda singular, plural, n: singular if n == 1 else plural
+
+def _initialize_for_command(profile, sdk_options):
+    """Run initialize_sdk() and check that the requested profile became active.
+
+    Returns False if the profile does not exist.
+    """
+    config = initialize_sdk(**sdk_options)
+    if profile != "default":
+        if config.get_active_profile() != profile:
+            print(f"Error switching profile: Profile '{profile}' not found", file=sys.stderr)
+            return False
+        logger.info(f"Switched to profile: {profile}")
+    return True
+
+def main(argv=None):
+    """Main entry point for the Quantum CLI SDK; returns the process exit code.
+
+    argv defaults to sys.argv[1:].
+    """
+    from .plugin_system import execute_plugin_command
+
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if argv == ["--version"]:
+        return _print_version()
+
+    # A bare --help prints the text formatted by an earlier run, if still
+    # current; so does running with no command at all (to stderr, as an error)
+    no_args = not argv
+    top_level_help = no_args or argv in (["-h"], ["--help"])
+    if top_level_help:
+        # No --profile on the command line here, so only QUANTUM_PROFILE can select one
+        help_text = _load_cached_help(_resolved_profile())
+        if help_text is not None:
+            return _print_top_help(help_text, no_args)
+
+    _disable_argparse_gettext()
+
+    pre_args, rest = _preparse_args(argv)
+    command = pre_args.command
+    if command is None and rest and len(rest[0]) > 2 and "--version".startswith(rest[0]):
+        # --version after global options only; the parser would print the same
+        return _print_version()
+    skip_plugins = os.environ.get("QUANTUM_SKIP_PLUGINS") == "1"
+    if skip_plugins and command is not None and command not in _SUBCMD_SETUP and command != "interactive":
+        print(f"Error: '{command}' is not a built-in command and plugin commands are disabled by QUANTUM_SKIP_PLUGINS=1",
+              file=sys.stderr)
+        return 2
+    # Built-in commands never need plugins, and only the ir commands use the transpiler.
+    # Help output lists every plugin command, so -h/--help loads all plugins
+    # rather than only the one providing the command.
+    help_requested = "-h" in rest or "--help" in rest
+    # The profile is passed to the config loader, so loading activates it
+    # directly (and the process environment is left unchanged)
+    sdk_options = dict(use_plugin_cache=not pre_args.no_plugin_cache,
+                       need_transpiler=command == "ir" or command not in _SUBCMD_SETUP,
+                       need_plugins=command not in _SUBCMD_SETUP and not skip_plugins,
+                       command=None if help_requested else command,
+                       profile=pre_args.profile if pre_args.profile != "default" else None)
+
+    # Plugin commands have to be registered before the parser is built.
+    # Built-in commands initialize after parsing, so usage errors skip it.
+    sdk_needed = _needs_sdk(command, rest)
+    if sdk_needed and command not in _SUBCMD_SETUP:
+        if not _initialize_for_command(pre_args.profile, sdk_options):
+            return 1
+    elif command in _SDK_FREE_COMMANDS:
+        _configure_logging()
+
+    # Built-in command parsers don't depend on plugins, and neither does the
+    # top-level parser (plugins are not loaded without a command), so both
+    # can be reused from disk. The cache is also keyed on the profile selected
+    # by the pre-parse and its config files.
+    profile = _resolved_profile(pre_args.profile)
+    cacheable = command is None or command in _SUBCMD_SETUP
+    parser = _load_cached_parser(command, profile) if cacheable else None
+    if parser is None:
+        parser = _build_parser(command)
+        if cacheable:
+            _save_cached_parser(command, profile, parser)
+
+    if top_level_help:
+        help_text = parser.format_help()
+        _save_cached_help(profile, help_text)
+        return _print_top_help(help_text, no_args)
+
+    args = parser.parse_args(argv)
+
+    if sdk_needed and command in _SUBCMD_SETUP:
+        if not _initialize_for_command(pre_args.profile, sdk_options):
+            return 1
 
     # --- Command Dispatch Logic --- 
 
-    if args.command == "ir":
-        handle_ir_commands(args)
-    elif args.command == "run":
-        handle_run_commands(args)
-    elif args.command == "analyze":
-        handle_analyze_commands(args)
-    elif args.command == "test":
-        handle_test_commands(args)
-    elif args.command == "service":
-        # Restore the call to the service command handler
-        handle_service_commands(args)
-    elif args.command == "package":
-        handle_package_commands(args)
-    elif args.command == "hub":
-        # handle_hub_commands(args) # Commented out
-        print(f"Command group '{args.command}' is not fully implemented yet.", file=sys.stderr)
-        parser.print_help(sys.stderr)
-        sys.exit(1)
-    elif args.command == "init":
-        handle_init_commands(args)
-    elif args.command == "version":
-        handle_versioning_commands(args)
-    elif args.command == "marketplace":
-        handle_marketplace_commands(args)
-    elif args.command == "share":
-        handle_sharing_commands(args)
-    elif args.command == "compare":
-        handle_compare_commands(args)
-    elif args.command == "hardware": # Keep old hardware command handler for now
-        handle_hardware_commands(args)
-    elif args.command == "jobs":
-        handle_job_commands(args)
-    elif args.command == "config":
-        handle_config_commands(args)
-    elif args.command == "deps":
-        handle_dependency_commands(args)
-    elif args.command == "visualize":
-        handle_visualization_commands(args)
-    elif args.command == "interactive":
-        start_shell()
-    elif args.command == "security":
-        handle_security_commands(args)
+    if args.command in _CONFIG_DEFAULT_COMMANDS:
+        _apply_config_defaults(args)
+
+    handler = _COMMAND_HANDLERS.get(args.command)
+    if handler is not None:
+        exit_code = handler(args)
+    elif getattr(args, "plugin", None) is not None:
+        # setup_plugin_subparsers() sets the plugin default on each plugin
+        # command, so no registry lookup is needed to recognize one
+        exit_code = execute_plugin_command(args)
     else:
-        # Check if it's a plugin command
-        if args.command in get_registered_command_plugins():
-            execute_plugin_command(args.command, args)
-        else:
-            # If the command is not recognized and not a plugin, show help
-            print(f"Error: Unknown command '{args.command}'", file=sys.stderr)
-            parser.print_help(sys.stderr)
-            sys.exit(1)
+        # If the command is not recognized and not a plugin, show help
+        print(f"Error: Unknown command '{args.command}'", file=sys.stderr)
+        parser.print_help(sys.stderr)
+        return 1
 
-    # Explicitly exit with 0 for success
-    sys.exit(0)
+    # Handlers return an exit code; None means success.
+    # Returning it lets the console-script wrapper exit without an extra SystemExit here.
+    return exit_code or 0
 
 # --- Command Handler Functions ---
 
+def _unknown_subcmd(group, name):
+    """Report an unrecognized subcommand of group and return the exit code."""
+    print(f"Error: Unknown {group} command '{name}'", file=sys.stderr)
+    return 1
+
+def _command_func(mod, name):
+    """Return mod.name, or report it and return None if the command module lacks it."""
+    func = getattr(mod, name, None)
+    if func is None:
+        logger.error(f"{name} function not found in {mod.__name__}. Cannot execute command.")
+        print("Error: Command implementation missing.", file=sys.stderr)
+    return func
+
+def _call_command(mod, name, *args, **kwargs):
+    """Call mod.name(*args, **kwargs) and return exit code 0 if the result is truthy, else 1."""
+    func = _command_func(mod, name)
+    if func is None:
+        return 1
+    return 0 if func(*args, **kwargs) else 1
+
+def _call_exiting_command(mod, name, args):
+    """Call a command function that reports failure with sys.exit() and return its exit code."""
+    func = _command_func(mod, name)
+    if func is None:
+        return 1
+    try:
+        func(args)
+    except SystemExit as e:
+        return e.code
+    return 0
+
 def handle_security_commands(args):
     """Handle security subcommands."""
+    from .commands import security_scan as security_scan_mod
+
     if args.security_cmd == "scan":
         if hasattr(security_scan_mod, 'security_scan'):
             # Pass the potentially None source_file and dest_file
             success = security_scan_mod.security_scan(source_file=args.input_file, dest_file=args.output_file)
             # The security_scan function returns True if no critical/high issues are found
             print(f"Security scan completed.{' No critical or high severity issues found.' if success else ' Issues found.'}")
-            sys.exit(0) # Exit 0 regardless of findings, but success indicates severity level
+            return 0 # Exit 0 regardless of findings, but success indicates severity level
         else:
             logger.error("security_scan function not found. Cannot execute command.")
             print("Error: Command implementation missing.", file=sys.stderr)
-            sys.exit(1)
+            return 1
     else:
-        print(f"Error: Unknown security command '{args.security_cmd}'", file=sys.stderr)
-        sys.exit(1)
+        return _unknown_subcmd("security", args.security_cmd)
 
 def handle_ir_commands(args):
     """Handle ir subcommands."""
+    from pathlib import Path
+
     if args.ir_cmd == "generate":
+        from .commands import generate_ir as ir_generate_mod
         # Pass LLM args to the generate_ir function
-        if hasattr(ir_generate_mod, 'generate_ir'):
-             success = ir_generate_mod.generate_ir(args.source, args.dest, args.use_llm, args.llm_provider, args.llm_model)
-             sys.exit(0 if success else 1)
-        else:
-             logger.error("generate_ir function not found in the corresponding module. Cannot execute command.")
-             print("Error: Command implementation missing.", file=sys.stderr)
-             sys.exit(1)
+        return _call_command(ir_generate_mod, 'generate_ir',
+                             args.source, args.dest, args.use_llm, args.llm_provider, args.llm_model)
     elif args.ir_cmd == "validate":
-        if hasattr(ir_validate_mod, 'validate_circuit'):
-             success = ir_validate_mod.validate_circuit(args.input_file, args.output_file, args.llm_url)
-             sys.exit(0 if success else 1)
-        else:
-             logger.error("validate_circuit function not found in the corresponding module. Cannot execute command.")
-             print("Error: Command implementation missing.", file=sys.stderr)
-             sys.exit(1)
+        from .commands import validate as ir_validate_mod
+        return _call_command(ir_validate_mod, 'validate_circuit', args.input_file, args.output_file, args.llm_url)
     elif args.ir_cmd == "optimize":
-        if hasattr(ir_optimize_mod, 'optimize_circuit_command'):
-            ir_optimize_mod.optimize_circuit_command(args)
-        else:
-             logger.error("optimize_circuit_command function not found. Cannot execute command.")
-             print("Error: Command implementation missing.", file=sys.stderr)
-             sys.exit(1)
+        from .commands.ir import optimize as ir_optimize_mod
+        return _call_exiting_command(ir_optimize_mod, 'optimize_circuit_command', args)
     elif args.ir_cmd == "mitigate":
-        # Call the refactored command function
-        if hasattr(ir_mitigate_mod, 'mitigate_circuit_command'):
-            ir_mitigate_mod.mitigate_circuit_command(args)
-            # The command function handles sys.exit internally
-        else:
-            logger.error("mitigate_circuit_command function not found. Cannot execute command.")
-            print("Error: Command implementation missing.", file=sys.stderr)
-            sys.exit(1)
+        from .commands.ir import mitigate as ir_mitigate_mod
+        # The command function calls sys.exit() itself on failure
+        return _call_exiting_command(ir_mitigate_mod, 'mitigate_circuit_command', args)
     elif args.ir_cmd == "finetune":
+        from .commands import finetune as ir_finetune_mod
+        from .utils import find_first_file
+
         if hasattr(ir_finetune_mod, 'finetune_circuit'):
             
             # Determine input file path
@@ -841,14 +1235,14 @@ def handle_ir_commands(args):
                 if not input_file_path:
                     logger.error(f"No .qasm file found in {default_ir_dir}. Please specify an input file.")
                     print(f"Error: No input file specified and no default found in {default_ir_dir}.", file=sys.stderr)
-                    sys.exit(1)
+                    return 1
                 logger.info(f"Using default input file for finetune: {input_file_path}")
             else:
                 input_file_path = Path(args.input_file)
                 if not input_file_path.is_file():
                      logger.error(f"Specified input file not found: {input_file_path}")
                      print(f"Error: Input file not found: {input_file_path}", file=sys.stderr)
-                     sys.exit(1)
+                     return 1
 
             # Determine output file path
             output_file_path: Path | None = None
@@ -878,271 +1272,216 @@ def handle_ir_commands(args):
                     # Add/remove/rename args as needed based on finetune_circuit definition
                 )
                 # Assuming finetune_circuit returns True/False or raises exception
-                sys.exit(0 if success else 1)
+                return 0 if success else 1
             except Exception as e:
                  logger.error(f"Finetuning failed for {input_file_path}: {e}", exc_info=True)
                  print(f"Error during finetuning: {e}", file=sys.stderr)
-                 sys.exit(1)
+                 return 1
         else:
             logger.error("finetune_circuit function not found. Cannot execute command.")
             print("Error: Command implementation missing.", file=sys.stderr)
-            sys.exit(1)
+            return 1
     else:
-        print(f"Error: Unknown ir command '{args.ir_cmd}'", file=sys.stderr)
-        sys.exit(1)
+        return _unknown_subcmd("ir", args.ir_cmd)
 
 def handle_run_commands(args):
     """Handle run subcommands (simulate, hw)."""
     if args.run_cmd == "simulate":
+        from .commands import simulate as simulate_mod
         # Use run_simulation directly
+        source_file, backend, output, shots = _RUN_SIMULATE_ARGS(args)
         success = simulate_mod.run_simulation(
-            source_file=args.qasm_file,
-            backend=args.backend,
-            output=args.output,
-            shots=args.shots
+            source_file=source_file,
+            backend=backend,
+            output=output,
+            shots=shots
         )
-        sys.exit(0 if success else 1)
+        return 0 if success else 1
     # Add handlers for other run commands (e.g., run hw) when implemented
     else:
-        print(f"Error: Unknown run command '{args.run_cmd}'", file=sys.stderr)
-        # Consider finding the parent parser to print help for the 'run' command
-        # parser.print_help(sys.stderr) # This prints help for the main command
-        sys.exit(1)
+        return _unknown_subcmd("run", args.run_cmd)
 
 def handle_test_commands(args):
     """Handle test subcommands."""
+    from .commands import generate_tests as test_generate_mod
+
     if args.test_cmd == "generate":
-        if hasattr(test_generate_mod, 'generate_tests'):
-            success = test_generate_mod.generate_tests(
-                input_file=args.input_file,
-                output_dir=args.output_dir,
-                llm_provider=args.llm_provider,
-                llm_model=args.llm_model
-            )
-            sys.exit(0 if success else 1)
-        else:
-            logger.error("generate_tests function not found in test_generate_mod. Cannot execute command.")
-            print("Error: Command implementation missing.", file=sys.stderr)
-            sys.exit(1)
+        return _call_command(
+            test_generate_mod, 'generate_tests',
+            input_file=args.input_file,
+            output_dir=args.output_dir,
+            llm_provider=args.llm_provider,
+            llm_model=args.llm_model
+        )
     elif args.test_cmd == "run":
-        if hasattr(test_generate_mod, 'run_tests'):
-            success = test_generate_mod.run_tests(
-                test_file=args.test_file,
-                output_file=args.output,
-                simulator=args.simulator,
-                shots=args.shots
-            )
-            sys.exit(0 if success else 1)
-        else:
-            logger.error("run_tests function not found in test_generate_mod. Cannot execute command.")
-            print("Error: Command implementation missing.", file=sys.stderr)
-            sys.exit(1)
+        return _call_command(
+            test_generate_mod, 'run_tests',
+            test_file=args.test_file,
+            output_file=args.output,
+            simulator=args.simulator,
+            shots=args.shots
+        )
     else:
-        print(f"Error: Unknown test command '{args.test_cmd}'", file=sys.stderr)
-        # Consider finding the parent parser to print help for the 'test' command
-        sys.exit(1)
-
+        return _unknown_subcmd("test", args.test_cmd)
+
+
+# analyze subcommand -> (default output directory, output file suffix, log label)
+_ANALYZE_OUTPUTS = {
+    "resources": ("results/analysis/resources", "_resources.json", ""),
+    "cost": ("results/analysis/cost", "_cost.json", " for cost analysis"),
+    "benchmark": ("results/analysis/benchmark", "_benchmark.json", " for benchmark"),
+}
+
+def _analyze_paths(args):
+    """Resolve the input QASM file and output path of an analyze subcommand.
+
+    Defaults to the first mitigated IR file and a per-subcommand results
+    file named after it; returns None if there is no input file.
+    """
+    from pathlib import Path
+    from .utils import find_first_file
+
+    default_output_dir, suffix, label = _ANALYZE_OUTPUTS[args.analyze_cmd]
+
+    # Determine input file path
+    if args.ir_file is None:
+        default_ir_dir = Path("ir/openqasm/mitigated")
+        logger.info(f"No IR file specified{label}. Searching in {default_ir_dir}...")
+        input_file_path = find_first_file(default_ir_dir, "*.qasm")
+        if not input_file_path:
+            logger.error(f"No .qasm file found in {default_ir_dir}. Please specify an input file.")
+            print(f"Error: No input file specified and no default found in {default_ir_dir}.", file=sys.stderr)
+            return None
+        logger.info(f"Using default input file{label}: {input_file_path}")
+    else:
+        input_file_path = Path(args.ir_file)
+        if not input_file_path.is_file():
+            logger.error(f"Specified input file not found: {input_file_path}")
+            print(f"Error: Input file not found: {input_file_path}", file=sys.stderr)
+            return None
+
+    # Determine output file path
+    if args.output is None:
+        output_dir = Path(default_output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_file_path = output_dir / f"{input_file_path.stem}{suffix}"
+        logger.info(f"No output file specified{label}. Defaulting to: {output_file_path}")
+    else:
+        output_file_path = Path(args.output)
+        output_file_path.parent.mkdir(parents=True, exist_ok=True)
+    return input_file_path, output_file_path
 
 def handle_analyze_commands(args):
     """Handle analyze subcommands."""
+    import json
+
     if args.analyze_cmd == "resources":
-        if hasattr(analyze_resources_mod, 'estimate_resources'):
-            
-            # Determine input file path
-            input_file_path: Path | None = None
-            if args.ir_file is None:
-                default_ir_dir = Path("ir/openqasm/mitigated")
-                logger.info(f"No IR file specified. Searching in {default_ir_dir}...")
-                input_file_path = find_first_file(default_ir_dir, "*.qasm")
-                if not input_file_path:
-                    logger.error(f"No .qasm file found in {default_ir_dir}. Please specify an input file.")
-                    print(f"Error: No input file specified and no default found in {default_ir_dir}.", file=sys.stderr)
-                    sys.exit(1)
-                logger.info(f"Using default input file: {input_file_path}")
-            else:
-                input_file_path = Path(args.ir_file)
-                if not input_file_path.is_file():
-                     logger.error(f"Specified input file not found: {input_file_path}")
-                     print(f"Error: Input file not found: {input_file_path}", file=sys.stderr)
-                     sys.exit(1)
-            
-            # Determine output file path
-            output_file_path: Path | None = None
-            if args.output is None:
-                default_output_dir = Path("results/analysis/resources")
-                default_output_dir.mkdir(parents=True, exist_ok=True) 
-                output_filename = f"{input_file_path.stem}_resources.json"
-                output_file_path = default_output_dir / output_filename
-                logger.info(f"No output file specified. Defaulting to: {output_file_path}")
-            else:
-                output_file_path = Path(args.output)
-                output_file_path.parent.mkdir(parents=True, exist_ok=True)
+        from .commands import estimate_resources as analyze_resources_mod
+        estimate_resources = _command_func(analyze_resources_mod, 'estimate_resources')
+        paths = _analyze_paths(args) if estimate_resources is not None else None
+        if paths is None:
+            return 1
+        input_file_path, output_file_path = paths
 
-            try:
-                # Call the resource estimation function
-                # Assume it handles output based on dest and potentially internal logic
-                # It might print to console AND save to dest
-                results_data = analyze_resources_mod.estimate_resources(
-                    source=str(input_file_path), 
-                    dest=str(output_file_path)
-                )
-                # The function might return the data or None/True/False
-                # If it returns data and format is json, maybe print?
-                if args.format == "json" and results_data:
-                     try:
-                         print(json.dumps(results_data, indent=2))
-                     except TypeError:
-                         # Handle case where results_data is not JSON serializable (e.g., boolean)
-                         logger.debug("estimate_resources returned non-JSON data, relying on function's own output.")
-                
-                # We assume success if no exception was raised
-                logger.info(f"Resource estimation process completed for {input_file_path}. Output expected at {output_file_path}")
-                sys.exit(0) 
-            except Exception as e:
-                 logger.error(f"Resource estimation failed for {input_file_path}: {e}", exc_info=True)
-                 print(f"Error during resource estimation: {e}", file=sys.stderr)
-                 sys.exit(1)
-        else:
-            logger.error("estimate_resources function not found. Cannot execute command.")
-            print("Error: Command implementation missing.", file=sys.stderr)
-            sys.exit(1)
+        try:
+            # Call the resource estimation function
+            # Assume it handles output based on dest and potentially internal logic
+            # It might print to console AND save to dest
+            results_data = estimate_resources(
+                source=str(input_file_path), 
+                dest=str(output_file_path)
+            )
+            # The function might return the data or None/True/False
+            # If it returns data and format is json, maybe print?
+            if args.format == "json" and results_data:
+                 try:
+                     print(json.dumps(results_data, indent=2))
+                 except TypeError:
+                     # Handle case where results_data is not JSON serializable (e.g., boolean)
+                     logger.debug("estimate_resources returned non-JSON data, relying on function's own output.")
+
+            # We assume success if no exception was raised
+            logger.info(f"Resource estimation process completed for {input_file_path}. Output expected at {output_file_path}")
+            return 0 
+        except Exception as e:
+             logger.error(f"Resource estimation failed for {input_file_path}: {e}", exc_info=True)
+             print(f"Error during resource estimation: {e}", file=sys.stderr)
+             return 1
     elif args.analyze_cmd == "cost":
-        if hasattr(calculate_cost, 'calculate_cost'):
-            
-            # Determine input file path
-            input_file_path: Path | None = None
-            if args.ir_file is None:
-                default_ir_dir = Path("ir/openqasm/mitigated")
-                logger.info(f"No IR file specified for cost analysis. Searching in {default_ir_dir}...")
-                input_file_path = find_first_file(default_ir_dir, "*.qasm")
-                if not input_file_path:
-                    logger.error(f"No .qasm file found in {default_ir_dir}. Please specify an input file.")
-                    print(f"Error: No input file specified and no default found in {default_ir_dir}.", file=sys.stderr)
-                    sys.exit(1)
-                logger.info(f"Using default input file for cost analysis: {input_file_path}")
-            else:
-                input_file_path = Path(args.ir_file)
-                if not input_file_path.is_file():
-                     logger.error(f"Specified input file not found: {input_file_path}")
-                     print(f"Error: Input file not found: {input_file_path}", file=sys.stderr)
-                     sys.exit(1)
+        from .commands import calculate_cost
+        calculate_cost_func = _command_func(calculate_cost, 'calculate_cost')
+        paths = _analyze_paths(args) if calculate_cost_func is not None else None
+        if paths is None:
+            return 1
+        input_file_path, output_file_path = paths
 
-            # Determine output file path
-            output_file_path: Path | None = None
-            if args.output is None:
-                default_output_dir = Path("results/analysis/cost")
-                default_output_dir.mkdir(parents=True, exist_ok=True)
-                output_filename = f"{input_file_path.stem}_cost.json"
-                output_file_path = default_output_dir / output_filename
-                logger.info(f"No output file specified for cost analysis. Defaulting to: {output_file_path}")
-            else:
-                output_file_path = Path(args.output)
-                output_file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            try:
-                # Call the cost calculation function
-                # Assume it handles saving to dest and printing summary
-                results = calculate_cost.calculate_cost(
-                    source=str(input_file_path),
-                    resource_file=args.resource_file, 
-                    dest=str(output_file_path),
-                    platform=args.platform,
-                    shots=args.shots,
-                    output_format=args.format 
-                )
-                
-                # Minimal handling here: maybe print JSON if requested and returned
-                if args.format == "json" and results:
-                    try: print(json.dumps(results, indent=2))
-                    except TypeError: logger.debug("calculate_cost returned non-JSON data")
-                # Rely on calculate_cost for text summary printout
-                                
-                # Success
-                sys.exit(0)
-            except Exception as e:
-                logger.error(f"Cost calculation failed for {input_file_path}: {e}", exc_info=True)
-                print(f"Error during cost calculation: {e}", file=sys.stderr)
-                sys.exit(1)
-        else:
-            logger.error("calculate_cost function not found. Cannot execute command.")
-            print("Error: Command implementation missing.", file=sys.stderr)
-            sys.exit(1)
+        try:
+            # Call the cost calculation function
+            # Assume it handles saving to dest and printing summary
+            results = calculate_cost_func(
+                source=str(input_file_path),
+                resource_file=args.resource_file, 
+                dest=str(output_file_path),
+                platform=args.platform,
+                shots=args.shots,
+                output_format=args.format 
+            )
+
+            # Minimal handling here: maybe print JSON if requested and returned
+            if args.format == "json" and results:
+                try: print(json.dumps(results, indent=2))
+                except TypeError: logger.debug("calculate_cost returned non-JSON data")
+            # Rely on calculate_cost for text summary printout
+
+            # Success
+            return 0
+        except Exception as e:
+            logger.error(f"Cost calculation failed for {input_file_path}: {e}", exc_info=True)
+            print(f"Error during cost calculation: {e}", file=sys.stderr)
+            return 1
     elif args.analyze_cmd == "benchmark":
-        if hasattr(analyze_benchmark_mod, 'benchmark'):
-            
-            # Determine input file path
-            input_file_path: Path | None = None
-            if args.ir_file is None:
-                default_ir_dir = Path("ir/openqasm/mitigated")
-                logger.info(f"No IR file specified for benchmark. Searching in {default_ir_dir}...")
-                input_file_path = find_first_file(default_ir_dir, "*.qasm")
-                if not input_file_path:
-                    logger.error(f"No .qasm file found in {default_ir_dir}. Please specify an input file.")
-                    print(f"Error: No input file specified and no default found in {default_ir_dir}.", file=sys.stderr)
-                    sys.exit(1)
-                logger.info(f"Using default input file for benchmark: {input_file_path}")
-            else:
-                input_file_path = Path(args.ir_file)
-                if not input_file_path.is_file():
-                     logger.error(f"Specified input file not found: {input_file_path}")
-                     print(f"Error: Input file not found: {input_file_path}", file=sys.stderr)
-                     sys.exit(1)
+        from .commands import benchmark as analyze_benchmark_mod
+        benchmark = _command_func(analyze_benchmark_mod, 'benchmark')
+        paths = _analyze_paths(args) if benchmark is not None else None
+        if paths is None:
+            return 1
+        input_file_path, output_file_path = paths
 
-            # Determine output file path
-            output_file_path: Path | None = None
-            if args.output is None:
-                default_output_dir = Path("results/analysis/benchmark")
-                default_output_dir.mkdir(parents=True, exist_ok=True)
-                output_filename = f"{input_file_path.stem}_benchmark.json"
-                output_file_path = default_output_dir / output_filename
-                logger.info(f"No output file specified for benchmark. Defaulting to: {output_file_path}")
-            else:
-                output_file_path = Path(args.output)
-                output_file_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            try:
-                # Call the benchmark function with CORRECT argument names
-                success = analyze_benchmark_mod.benchmark(
-                    source_file=str(input_file_path), 
-                    dest_file=str(output_file_path)
-                )
-                sys.exit(0 if success else 1)
-            except Exception as e:
-                 logger.error(f"Benchmark failed for {input_file_path}: {e}", exc_info=True)
-                 print(f"Error during benchmark: {e}", file=sys.stderr)
-                 sys.exit(1)
-        else:
-            logger.error("benchmark function not found. Cannot execute command.")
-            print("Error: Command implementation missing.", file=sys.stderr)
-            sys.exit(1)
+        try:
+            # Call the benchmark function with CORRECT argument names
+            success = benchmark(
+                source_file=str(input_file_path), 
+                dest_file=str(output_file_path)
+            )
+            return 0 if success else 1
+        except Exception as e:
+             logger.error(f"Benchmark failed for {input_file_path}: {e}", exc_info=True)
+             print(f"Error during benchmark: {e}", file=sys.stderr)
+             return 1
     else:
         print(f"Command 'analyze {args.analyze_cmd}' is not implemented yet.", file=sys.stderr)
-        sys.exit(1)
+        return 1
 
 def handle_init_commands(args):
     """Handle init subcommands."""
-    from .commands import init as init_mod
-    
     if args.init_cmd == "list":
         # List available templates
-        # For now just return with success - we only have one template 
+        # quantum_app is the only project template (the package's templates
+        # directory holds scaffolding files it copies, not choosable templates),
+        # so listing doesn't need to import the init command module
         print("Available templates:\n  - quantum_app: Standard Quantum Application (default)")
-        sys.exit(0)
+        return 0
     elif args.init_cmd == "create":
+        from .commands import init as init_mod
+
         # Create new project
-        if hasattr(init_mod, 'init_project'):
-            success = init_mod.init_project(
-                project_dir=args.directory,
-                overwrite=args.overwrite if hasattr(args, 'overwrite') else False
-            )
-            sys.exit(0 if success else 1)
-        else:
-            logger.error("init_project function not found in the init module. Cannot execute command.")
-            print("Error: Command implementation missing.", file=sys.stderr)
-            sys.exit(1)
+        return _call_command(
+            init_mod, 'init_project',
+            project_dir=args.directory,
+            overwrite=args.overwrite if hasattr(args, 'overwrite') else False
+        )
     else:
-        print(f"Error: Unknown init command '{args.init_cmd}'", file=sys.stderr)
-        sys.exit(1)
+        return _unknown_subcmd("init", args.init_cmd)
 
 def handle_service_commands(args):
     """Handle service subcommands."""
@@ -1189,11 +1528,11 @@ def handle_service_commands(args):
                 logger.info(f"Microservice generation initiated.") # Changed log message slightly
                 print(f"Microservice generation initiated.") # Changed print message slightly
             
-            sys.exit(0 if success else 1)
+            return 0 if success else 1
         else:
             logger.error("generate_microservice function not found in microservice module. Cannot execute command.")
             print("Error: Command implementation missing.", file=sys.stderr)
-            sys.exit(1)
+            return 1
     
     elif args.service_cmd == "run":
         # Run the microservice with Docker
@@ -1203,14 +1542,14 @@ def handle_service_commands(args):
         if not os.path.exists(service_dir_abs):
             logger.error(f"Service directory not found: {service_dir_abs}")
             print(f"Error: Service directory not found: {service_dir_abs}", file=sys.stderr)
-            sys.exit(1)
+            return 1
         
         # Check for Dockerfile in the service directory
         dockerfile_path = os.path.join(service_dir_abs, "Dockerfile")
         if not os.path.exists(dockerfile_path):
             logger.error(f"Dockerfile not found in: {service_dir_abs}")
             print(f"Error: Dockerfile not found in: {service_dir_abs}", file=sys.stderr)
-            sys.exit(1)
+            return 1
         
         # Build the Docker image
         project_root = os.path.basename(os.path.dirname(service_dir_abs))
@@ -1225,7 +1564,7 @@ def handle_service_commands(args):
         if not build_result.get("success", False):
             logger.error(f"Failed to build Docker image: {build_result.get('stderr', '')}")
             print(f"Error: Failed to build Docker image\n{build_result.get('stderr', '')}", file=sys.stderr)
-            sys.exit(1)
+            return 1
         
         # Run the Docker container
         port = args.port if hasattr(args, 'port') else 8889
@@ -1263,7 +1602,7 @@ def handle_service_commands(args):
         if not run_result.get("success", False):
             logger.error(f"Failed to run Docker container: {run_result.get('stderr', '')}")
             print(f"Error: Failed to run Docker container\n{run_result.get('stderr', '')}", file=sys.stderr)
-            sys.exit(1)
+            return 1
         
         container_id = run_result.get("stdout", "").strip()
         if hasattr(args, 'detach') and args.detach and container_id:
@@ -1274,40 +1613,33 @@ def handle_service_commands(args):
     elif args.service_cmd == "test-generate":
         from .commands import generate_microservice_tests
         
-        if hasattr(generate_microservice_tests, 'generate_microservice_tests'):
-            success = generate_microservice_tests.generate_microservice_tests(
-                microservice_dir=args.service_dir,
-                output_dir=args.output
-            )
-            sys.exit(0 if success else 1)
-        else:
-            logger.error("generate_microservice_tests function not found. Cannot execute command.")
-            print("Error: Command implementation missing.", file=sys.stderr)
-            sys.exit(1)
+        return _call_command(
+            generate_microservice_tests, 'generate_microservice_tests',
+            microservice_dir=args.service_dir,
+            output_dir=args.output
+        )
     
     elif args.service_cmd == "test-run":
         from .commands import run_microservice_tests
         
-        if hasattr(run_microservice_tests, 'run_microservice_tests'):
-            success = run_microservice_tests.run_microservice_tests(
-                microservice_dir=args.service_dir,
-                test_dir=args.test_dir,
-                output_file=args.output,
-                blocking=args.blocking if hasattr(args, 'blocking') else False
-            )
-            sys.exit(0 if success else 1)
-        else:
-            logger.error("run_microservice_tests function not found. Cannot execute command.")
-            print("Error: Command implementation missing.", file=sys.stderr)
-            sys.exit(1)
+        return _call_command(
+            run_microservice_tests, 'run_microservice_tests',
+            microservice_dir=args.service_dir,
+            test_dir=args.test_dir,
+            output_file=args.output,
+            blocking=args.blocking if hasattr(args, 'blocking') else False
+        )
     
     else:
-        print(f"Error: Unknown service command '{args.service_cmd}'", file=sys.stderr)
-        sys.exit(1)
+        return _unknown_subcmd("service", args.service_cmd)
 
 def handle_config_commands(args):
     """Handle configuration commands."""
+    import json
     from . import config as config_mod
+
+    # main() skips initialize_sdk() for config commands; only the config file is needed
+    config_mod.initialize_config(profile=args.profile if args.profile != "default" else None)
     
     if args.config_cmd == "get":
         # Get configuration value
@@ -1316,7 +1648,7 @@ def handle_config_commands(args):
             print(value)
         else:
             print(f"Configuration value not found: {args.path}", file=sys.stderr)
-            sys.exit(1)
+            return 1
     elif args.config_cmd == "set":
         # Set configuration value
         if args.path.startswith("quantum_providers."):
@@ -1329,10 +1661,10 @@ def handle_config_commands(args):
                 config_mod.get_config().save_config()
             else:
                 print(f"Invalid provider configuration path: {args.path}", file=sys.stderr)
-                sys.exit(1)
+                return 1
         else:
             # Handle other configuration settings
-            config_mod.get_config().set_setting(args.path, args.value)
+            config_mod.get_config().set_setting(args.path, _parse_config_value(args.value))
             config_mod.get_config().save_config()
     elif args.config_cmd == "print":
         # Print entire configuration
@@ -1356,22 +1688,21 @@ def handle_config_commands(args):
             if config_mod.get_config().create_profile(args.name):
                 print(f"Created profile: {args.name}")
             else:
-                sys.exit(1)
+                return 1
         elif args.profile_cmd == "load":
             # Load profile
             if config_mod.get_config().set_active_profile(args.name):
                 print(f"Loaded profile: {args.name}")
             else:
-                sys.exit(1)
+                return 1
         elif args.profile_cmd == "delete":
             # Delete profile
             if config_mod.get_config().delete_profile(args.name):
                 print(f"Deleted profile: {args.name}")
             else:
-                sys.exit(1)
+                return 1
         else:
-            print(f"Unknown profile command: {args.profile_cmd}", file=sys.stderr)
-            sys.exit(1)
+            return _unknown_subcmd("profile", args.profile_cmd)
     elif args.config_cmd == "export":
         # Export configuration
         try:
@@ -1380,7 +1711,7 @@ def handle_config_commands(args):
             print(f"Configuration exported to: {args.output_file}")
         except Exception as e:
             print(f"Failed to export configuration: {e}", file=sys.stderr)
-            sys.exit(1)
+            return 1
     elif args.config_cmd == "import":
         # Import configuration
         try:
@@ -1391,20 +1722,21 @@ def handle_config_commands(args):
             print(f"Configuration imported from: {args.input_file}")
         except Exception as e:
             print(f"Failed to import configuration: {e}", file=sys.stderr)
-            sys.exit(1)
+            return 1
     else:
-        print(f"Unknown config command: {args.config_cmd}", file=sys.stderr)
-        sys.exit(1)
+        return _unknown_subcmd("config", args.config_cmd)
 
 def handle_package_commands(args):
     """Handle package subcommands."""
+    import json
+
     if args.package_cmd == "create":
         from .commands import package as package_mod
         
         # Convert comma-separated strings to lists if provided
-        requirements = args.requirements.split(',') if args.requirements else None
-        include = args.include.split(',') if args.include else None
-        exclude = args.exclude.split(',') if args.exclude else None
+        requirements = _split_csv(args.requirements)
+        include = _split_csv(args.include)
+        exclude = _split_csv(args.exclude)
         
         # Create config overrides
         config_overrides = {}
@@ -1428,10 +1760,10 @@ def handle_package_commands(args):
         
         if result:
             print(f"Package created: {result}")
-            sys.exit(0)
+            return 0
         else:
             print("Failed to create package", file=sys.stderr)
-            sys.exit(1)
+            return 1
             
     elif args.package_cmd == "info":
         from .commands import package as package_mod
@@ -1440,7 +1772,7 @@ def handle_package_commands(args):
         info = package_mod.extract_package_info(args.package_path)
         if not info:
             print("Failed to extract package information", file=sys.stderr)
-            sys.exit(1)
+            return 1
             
         # Format output
         if args.format == "json":
@@ -1462,7 +1794,7 @@ def handle_package_commands(args):
             for file in info.get('files', []):
                 print(f"  - {file}")
                 
-        sys.exit(0)
+        return 0
         
     elif args.package_cmd == "extract":
         from .commands import package as package_mod
@@ -1479,14 +1811,47 @@ def handle_package_commands(args):
         
         if success:
             print(f"Package extracted to: {output_dir}")
-            sys.exit(0)
+            return 0
         else:
             print("Failed to extract package", file=sys.stderr)
-            sys.exit(1)
+            return 1
             
     else:
-        print(f"Error: Unknown package command '{args.package_cmd}'", file=sys.stderr)
-        sys.exit(1)
+        return _unknown_subcmd("package", args.package_cmd)
+
+def handle_unimplemented_commands(args):
+    """Report a command group that has a parser but no handler yet."""
+    print(f"Command group '{args.command}' is not fully implemented yet.", file=sys.stderr)
+    print("Run 'quantum-cli --help' to see the available commands.", file=sys.stderr)
+    return 1
+
+def handle_interactive_command(args):
+    """Start the interactive shell."""
+    from .interactive import start_shell
+    return start_shell()
+
+# Command name -> handler for built-in commands
+_COMMAND_HANDLERS = {
+    "ir": handle_ir_commands,
+    "run": handle_run_commands,
+    "analyze": handle_analyze_commands,
+    "test": handle_test_commands,
+    "service": handle_service_commands,
+    "package": handle_package_commands,
+    "hub": handle_unimplemented_commands,
+    "init": handle_init_commands,
+    "version": handle_unimplemented_commands,
+    "marketplace": handle_unimplemented_commands,
+    "share": handle_unimplemented_commands,
+    "compare": handle_unimplemented_commands,
+    "find-hardware": handle_unimplemented_commands,
+    "jobs": handle_unimplemented_commands,
+    "config": handle_config_commands,
+    "deps": handle_unimplemented_commands,
+    "visualize": handle_unimplemented_commands,
+    "interactive": handle_interactive_command,
+    "security": handle_security_commands,
+}
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
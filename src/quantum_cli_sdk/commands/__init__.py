@@ -8,14 +8,9 @@ Commands for the quantum CLI SDK.
 # Avoid importing submodules directly here if they are used by cli.py,
 # as it can lead to circular dependencies.
 
-# Example: If cli.py imports `from .commands import run`, don't do `from . import run` here.
-
-# The imports below were causing circular import issues and are removed.
-# from . import run
-# from . import (
-#     generate_ir, validate, security_scan, simulate, optimize,
-#     generate_tests, test, hw_run, finetune, visualize,
-#     benchmark, microservice, package, publish, provision, run_app,
-#     estimate_resources, template, mitigate, calculate_cost, init,
-#     generate_microservice_tests, trial
-# )
+# cli.py imports each command module inside the handler branch that uses it
+# (e.g. `from .commands import init as init_mod`), so a module is loaded the
+# first time its command runs and comes from sys.modules after that. Keep
+# heavy backend imports (qiskit, cirq, braket, LLM SDKs) inside the functions
+# that need them rather than at the top of a command module, so importing the
+# module stays cheap.
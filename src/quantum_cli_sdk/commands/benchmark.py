@@ -8,22 +8,205 @@ import logging
 import json
 import csv
 import time
-import glob
-import re
+import hashlib
+import functools
+import mmap
+import threading
+from collections import Counter
+from operator import itemgetter
 from pathlib import Path
 import datetime
-import matplotlib.pyplot as plt
-import numpy as np
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
-from ..config import get_config
-from ..quantum_circuit import QuantumCircuit
-from ..output_formatter import format_output
-from ..benchmark_runner import BenchmarkRunner
+# matplotlib and numpy are imported by the plot helpers, and qiskit by
+# run_benchmark, so that loading results and writing reports stays fast
+
+# Use orjson when it is installed; it decodes and encodes JSON several times faster
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
+# Below this many files, starting worker processes costs more than it saves
+_PARALLEL_LOAD_MIN_FILES = 64
+
+# Keys that mark a JSON file as a results file
+_RESULT_KEYS = ("counts", "results", "success")
+# The same keys as they must appear, quoted, in the raw file
+_RESULT_KEY_MARKERS = tuple(f'"{key}"'.encode() for key in _RESULT_KEYS)
+
+def _loads(raw):
+    """Decode JSON bytes, with orjson if available (its decode errors subclass json.JSONDecodeError)."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+def _read_json(file_path):
+    """Parse a JSON file."""
+    with open(file_path, 'rb') as f:
+        return _loads(f.read())
+
+def _read_json_mapped(file_path):
+    """Parse a possibly large JSON file; orjson reads it straight from a memory map, without a bytes copy."""
+    with open(file_path, 'rb') as f:
+        if not ORJSON_AVAILABLE or os.fstat(f.fileno()).st_size == 0:
+            return _loads(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
+def _write_json(data, file_path):
+    """Write data as JSON indented by 2 spaces, with orjson if available."""
+    if ORJSON_AVAILABLE:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+def _load_one(file_path):
+    """
+    Load one JSON file from a results directory.
+    
+    Args:
+        file_path (str): Path to the JSON file
+        
+    Returns:
+        dict: The loaded result, or None if the file is not a results file
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        
+        # A results file has one of the result keys somewhere in its text, so
+        # unrelated JSON (configs, manifests) is skipped without decoding it
+        if not any(marker in raw for marker in _RESULT_KEY_MARKERS):
+            logger.debug(f"Skipping {file_path} - doesn't appear to be a results file")
+            return None
+        
+        data = _loads(raw)
+        
+        # Add file path to data for reference
+        data["_file_path"] = file_path
+        
+        # Skip files that don't look like results
+        if not isinstance(data, dict) or not any(key in data for key in _RESULT_KEYS):
+            logger.debug(f"Skipping {file_path} - doesn't appear to be a results file")
+            return None
+            
+        return data
+            
+    except json.JSONDecodeError:
+        logger.warning(f"Could not parse JSON from {file_path}")
+    except Exception as e:
+        logger.warning(f"Error loading {file_path}: {e}")
+    return None
+
+# Circuit metrics from earlier run_benchmark calls, keyed by a hash of the QASM text.
+# The file records the Qiskit version that computed them; after an upgrade it starts empty.
+_CIRCUIT_METRICS_CACHE = os.path.join(os.path.expanduser("~"), ".quantum-cli", "circuit-metrics.json")
+_CIRCUIT_METRICS_CACHE_MAX_ENTRIES = 1024
+# run_benchmarks() calls run_benchmark() from several threads
+_CIRCUIT_METRICS_LOCK = threading.Lock()
+# Whether metrics were added since the cache file was last written
+_circuit_metrics_changed = False
+
+def _qiskit_version():
+    from qiskit import __version__
+    return __version__
+
+@functools.lru_cache(maxsize=1)
+def _circuit_metrics_cache():
+    """Load the circuit metrics cache once per process (empty if missing, unreadable or stale)."""
+    try:
+        data = _read_json(_CIRCUIT_METRICS_CACHE)
+    except Exception:
+        return {}
+    if not isinstance(data, dict) or data.get("qiskit_version") != _qiskit_version():
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+def _save_circuit_metrics_cache():
+    """
+    Atomically rewrite the circuit metrics cache if metrics were added since the last write.
+    
+    Only the newest entries are kept. Called once per run_benchmark() or
+    run_benchmarks() call; the file is written outside the lock, from a
+    snapshot of the entries.
+    """
+    global _circuit_metrics_changed
+    with _CIRCUIT_METRICS_LOCK:
+        if not _circuit_metrics_changed:
+            return
+        cache = _circuit_metrics_cache()
+        while len(cache) > _CIRCUIT_METRICS_CACHE_MAX_ENTRIES:
+            del cache[next(iter(cache))]
+        entries = dict(cache)
+        _circuit_metrics_changed = False
+    tmp_path = f"{_CIRCUIT_METRICS_CACHE}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(_CIRCUIT_METRICS_CACHE), exist_ok=True)
+        _write_json({"qiskit_version": _qiskit_version(), "entries": entries}, tmp_path)
+        os.replace(tmp_path, _CIRCUIT_METRICS_CACHE)
+    except Exception as e:
+        logger.debug(f"Could not write circuit metrics cache: {e}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+def _circuit_metrics(circuit, qasm):
+    """
+    Get qubit count, depth and gate counts of a circuit, reusing cached values for the same QASM.
+    
+    Args:
+        circuit: Qiskit QuantumCircuit parsed from qasm
+        qasm (str): The circuit's QASM source, used as the cache key
+        
+    Returns:
+        dict: The "circuit" fields of a run_benchmark result, without the name
+    """
+    global _circuit_metrics_changed
+    key = hashlib.blake2b(qasm.encode(), digest_size=16).hexdigest()
+    with _CIRCUIT_METRICS_LOCK:
+        cache = _circuit_metrics_cache()
+        cached = cache.get(key)
+    if cached is not None:
+        return _copy_circuit_metrics(cached)
+    
+    # Count by gate type
+    gate_counts = dict(circuit.count_ops())
+    
+    # Calculate single qubit and two qubit gates
+    single_qubit_gates = sum(count for gate, count in gate_counts.items() 
+                           if gate in ['h', 'x', 'y', 'z', 's', 't', 'rx', 'ry', 'rz'])
+    two_qubit_gates = sum(count for gate, count in gate_counts.items() 
+                         if gate in ['cx', 'cz', 'swap', 'cp'])
+    
+    metrics = {
+        "qubits": circuit.num_qubits,
+        "depth": circuit.depth(),
+        "gates": {
+            "total": sum(gate_counts.values()),
+            "single_qubit": single_qubit_gates,
+            "two_qubit": two_qubit_gates,
+            "by_type": gate_counts
+        }
+    }
+    with _CIRCUIT_METRICS_LOCK:
+        cache[key] = metrics
+        _circuit_metrics_changed = True
+    return _copy_circuit_metrics(metrics)
+
+def _copy_circuit_metrics(metrics):
+    """Copy cached circuit metrics so callers can modify the result (extract_metrics does)."""
+    gates = metrics["gates"]
+    return {**metrics, "gates": {**gates, "by_type": dict(gates["by_type"])}}
+
 def load_results(source_path):
     """
     Load results from a file or directory.
@@ -39,42 +222,30 @@ def load_results(source_path):
         
         if os.path.isfile(source_path):
             # Load single file
-            with open(source_path, 'r') as f:
-                try:
-                    data = json.load(f)
-                    results.append(data)
-                    logger.info(f"Loaded results from {source_path}")
-                except json.JSONDecodeError:
-                    logger.error(f"Could not parse JSON from {source_path}")
-                    return []
+            try:
+                data = _read_json_mapped(source_path)
+                results.append(data)
+                logger.info(f"Loaded results from {source_path}")
+            except json.JSONDecodeError:
+                logger.error(f"Could not parse JSON from {source_path}")
+                return []
                     
         elif os.path.isdir(source_path):
             # Load all JSON files in directory
-            json_files = glob.glob(os.path.join(source_path, "**", "*.json"), recursive=True)
+            json_files = [str(path) for path in Path(source_path).rglob("*.json")]
             
             if not json_files:
                 logger.error(f"No JSON files found in {source_path}")
                 return []
                 
-            for file_path in json_files:
-                try:
-                    with open(file_path, 'r') as f:
-                        data = json.load(f)
-                        
-                        # Add file path to data for reference
-                        data["_file_path"] = file_path
-                        
-                        # Skip files that don't look like results
-                        if not isinstance(data, dict) or not any(key in data for key in ["counts", "results", "success"]):
-                            logger.debug(f"Skipping {file_path} - doesn't appear to be a results file")
-                            continue
-                            
-                        results.append(data)
-                        
-                except json.JSONDecodeError:
-                    logger.warning(f"Could not parse JSON from {file_path}")
-                except Exception as e:
-                    logger.warning(f"Error loading {file_path}: {e}")
+            # JSON decoding is CPU-bound and holds the GIL, so large
+            # directories are parsed across processes
+            if len(json_files) >= _PARALLEL_LOAD_MIN_FILES:
+                with ProcessPoolExecutor() as executor:
+                    loaded = list(executor.map(_load_one, json_files, chunksize=32))
+            else:
+                loaded = [_load_one(file_path) for file_path in json_files]
+            results = [data for data in loaded if data is not None]
                     
             logger.info(f"Loaded {len(results)} result files from {source_path}")
         else:
@@ -106,7 +277,7 @@ def extract_metrics(results):
         "execution_times": [],
         "circuit_depths": [],
         "circuit_widths": [], # Keep width if needed, though run_benchmark doesn't provide it
-        "gate_counts": {},
+        "gate_counts": Counter(),
         "distribution_fidelities": [],
         "detailed_metrics": []
     }
@@ -145,18 +316,21 @@ def extract_metrics(results):
         if success:    
             num_successful += 1
             
-        # Track execution time
+        # Track execution time; results without one (e.g. bare counts files)
+        # add nothing to the list, so a measured time of zero stays distinct
         execution_time = 0
         if is_run_benchmark_format:
             execution_time = result["execution"].get("time_seconds", 0)
+            metrics["execution_times"].append(execution_time)
         elif "execution_time" in result:
              execution_time = result["execution_time"]
-        metrics["execution_times"].append(execution_time)
+             metrics["execution_times"].append(execution_time)
             
-        # Track circuit metrics
+        # Track circuit metrics, again only for results that carry them
         circuit_depth = 0
         circuit_width = 0 # run_benchmark doesn't provide width currently
         gate_counts = {}
+        has_circuit_metrics = is_run_benchmark_format or "circuit_metrics" in result
         if is_run_benchmark_format:
             cm = result["circuit"]
             circuit_depth = cm.get("depth", 0)
@@ -171,10 +345,10 @@ def extract_metrics(results):
             circuit_width = cm.get("width", 0)
             gate_counts = cm.get("gate_counts", {})
         
-        metrics["circuit_depths"].append(circuit_depth)
-        metrics["circuit_widths"].append(circuit_width)
-        for gate, count in gate_counts.items():
-            metrics["gate_counts"][gate] = metrics["gate_counts"].get(gate, 0) + count
+        if has_circuit_metrics:
+            metrics["circuit_depths"].append(circuit_depth)
+            metrics["circuit_widths"].append(circuit_width)
+        metrics["gate_counts"].update(gate_counts)
                     
         # Track fidelity if available (run_benchmark doesn't provide distribution fidelity)
         fidelity = 0
@@ -200,12 +374,19 @@ def extract_metrics(results):
         metrics["success_rate"] = num_successful / len(results)
         metrics["error_rate"] = 1 - metrics["success_rate"]
     
-    # Convert sets to lists for JSON serialization
+    # Convert sets to lists, and the Counter to a plain dict, for JSON serialization
     metrics["simulators"] = list(metrics["simulators"])
     metrics["platforms"] = list(metrics["platforms"])
+    metrics["gate_counts"] = dict(metrics["gate_counts"])
     
     return metrics
 
+@functools.lru_cache(maxsize=1)
+def _aer_simulator():
+    """Create the Aer simulator once and reuse it for every run_benchmark call."""
+    from qiskit_aer import AerSimulator
+    return AerSimulator()
+
 def run_benchmark(source_path, shots=1000):
     """
     Run a benchmark directly on a circuit file.
@@ -217,15 +398,18 @@ def run_benchmark(source_path, shots=1000):
     Returns:
         dict: Benchmark results or None on error
     """
+    try:
+        return _run_benchmark(source_path, shots)
+    finally:
+        _save_circuit_metrics_cache()
+
+def _run_benchmark(source_path, shots):
+    """run_benchmark() without saving the circuit metrics cache."""
     try:
         # Import required modules
         try:
-            import qiskit
             from qiskit import QuantumCircuit, transpile
-            from qiskit.converters import circuit_to_dag
-            from qiskit_aer import Aer
-            from qiskit_aer import AerSimulator
-            import time
+            simulator = _aer_simulator()
         except ImportError as e:
             logger.error(f"Qiskit import error: {e}")
             return None
@@ -246,19 +430,8 @@ def run_benchmark(source_path, shots=1000):
             logger.error(f"Error loading QASM circuit from {source_path}: {e}")
             return None
             
-        # Get circuit metrics
-        num_qubits = circuit.num_qubits
-        depth = circuit.depth()
-        num_gates = sum(circuit.count_ops().values())
-        
-        # Count by gate type
-        gate_counts = circuit.count_ops()
-        
-        # Calculate single qubit and two qubit gates
-        single_qubit_gates = sum(count for gate, count in gate_counts.items() 
-                               if gate in ['h', 'x', 'y', 'z', 's', 't', 'rx', 'ry', 'rz'])
-        two_qubit_gates = sum(count for gate, count in gate_counts.items() 
-                             if gate in ['cx', 'cz', 'swap', 'cp'])
+        # Get circuit metrics (cached across runs of the same circuit)
+        circuit_metrics = _circuit_metrics(circuit, qasm)
         
         # Measure execution time
         start_time = time.time()
@@ -268,26 +441,15 @@ def run_benchmark(source_path, shots=1000):
         
         # Run simulation
         try:
-            simulator = AerSimulator()
             job = simulator.run(transpiled_circuit, shots=shots)
-            result = job.result()
-            
-            # Get counts
-            counts = result.get_counts()
+            job.result()  # Wait for the simulation to finish
             execution_time = time.time() - start_time
             
             # Prepare benchmark results using source_path for name
             benchmark_result = {
                 "circuit": {
                     "name": circuit_file_path.stem, # Use stem from Path object
-                    "qubits": num_qubits,
-                    "depth": depth,
-                    "gates": {
-                        "total": num_gates,
-                        "single_qubit": single_qubit_gates,
-                        "two_qubit": two_qubit_gates,
-                        "by_type": gate_counts
-                    }
+                    **circuit_metrics
                 },
                 "execution": {
                     "backend": "qiskit_aer",
@@ -311,10 +473,105 @@ def run_benchmark(source_path, shots=1000):
         logger.error(f"Error in run_benchmark for {source_path}: {e}")
         return None
 
+def run_benchmarks(circuit_files, shots=1000, max_workers=None):
+    """
+    Run benchmarks on several circuit files concurrently.
+    
+    Aer releases the GIL while it simulates, so the circuits run in parallel
+    threads sharing one simulator. Each result's execution time is measured
+    while the other circuits are running too.
+    
+    Args:
+        circuit_files (list): Paths to circuit files to benchmark
+        shots (int): Number of shots per circuit
+        max_workers (int, optional): Number of threads (defaults to the CPU count)
+        
+    Returns:
+        list: Benchmark results in the order of circuit_files, None for failed runs
+    """
+    if not circuit_files:
+        return []
+    max_workers = min(max_workers or os.cpu_count() or 1, len(circuit_files))
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda path: _run_benchmark(path, shots), circuit_files))
+    finally:
+        # One write for all the circuits instead of one per new circuit
+        _save_circuit_metrics_cache()
+
+# Fast zlib level for the plot PNGs: Pillow's default (6) dominates savefig time
+# for these flat-colour charts; level 1 makes the files about 1.5x larger
+_PNG_PIL_KWARGS = {"compress_level": 1}
+
+# Each plot worker imports pyplot before it can render (about 0.6s here, against
+# roughly 0.2s per plot), so the pool only beats rendering in-process once there
+# are this many plots to spread over the cores
+_PARALLEL_PLOT_MIN_COUNT = 4
+
+def _use_agg_backend():
+    """Select the non-interactive backend (also used as the plot workers' initializer)."""
+    import matplotlib
+    matplotlib.use('Agg')
+
+def _plot_histogram(values, xlabel, title, path):
+    """Save a 20-bin histogram of values to path."""
+    import matplotlib.pyplot as plt
+    import numpy as np
+    
+    # Bin with NumPy and draw the bars directly, skipping plt.hist's input handling
+    counts, edges = np.histogram(values, bins=20)
+    plt.figure(figsize=(10, 6))
+    plt.bar(edges[:-1], counts, width=np.diff(edges), align="edge")
+    plt.xlabel(xlabel)
+    plt.ylabel("Frequency")
+    plt.title(title)
+    plt.grid(True, alpha=0.3)
+    
+    plt.savefig(path, pil_kwargs=_PNG_PIL_KWARGS)
+    plt.close()
+    return path
+
+def _plot_bar(labels, counts, xlabel, title, figsize, path):
+    """Save a bar chart of counts per label to path."""
+    import matplotlib.pyplot as plt
+    
+    plt.figure(figsize=figsize)
+    plt.bar(labels, counts)
+    plt.xlabel(xlabel)
+    plt.ylabel("Count")
+    plt.title(title)
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+    
+    plt.savefig(path, pil_kwargs=_PNG_PIL_KWARGS)
+    plt.close()
+    return path
+
+def _plot_success_rate(success_rate, error_rate, path):
+    """Save a success vs error pie chart to path."""
+    import matplotlib.pyplot as plt
+    
+    plt.figure(figsize=(8, 8))
+    plt.pie(
+        [success_rate, error_rate], 
+        labels=["Success", "Error"],
+        autopct="%1.1f%%",
+        colors=["#4CAF50", "#F44336"]
+    )
+    plt.title("Success vs Error Rate")
+    
+    plt.savefig(path, pil_kwargs=_PNG_PIL_KWARGS)
+    plt.close()
+    return path
+
 def create_visualizations(metrics, dest_dir):
     """
     Create benchmark visualization plots.
     
+    The plots are independent, so with enough of them on a multi-core
+    machine they are rendered in parallel worker processes; each worker
+    only receives the data its plot needs.
+    
     Args:
         metrics (dict): Extracted metrics
         dest_dir (str): Destination directory
@@ -323,109 +580,64 @@ def create_visualizations(metrics, dest_dir):
         list: Paths to created visualization files
     """
     try:
-        import matplotlib
-        matplotlib.use('Agg')  # Use non-interactive backend
-        
-        created_files = []
+        _use_agg_backend()  # Use non-interactive backend
         
         # Create output directory
         os.makedirs(dest_dir, exist_ok=True)
         
+        plots = []
+        
         # 1. Execution Time Distribution
         if metrics["execution_times"]:
-            plt.figure(figsize=(10, 6))
-            plt.hist(metrics["execution_times"], bins=20)
-            plt.xlabel("Execution Time (s)")
-            plt.ylabel("Frequency")
-            plt.title("Distribution of Execution Times")
-            plt.grid(True, alpha=0.3)
-            
-            time_plot_path = os.path.join(dest_dir, "execution_time_distribution.png")
-            plt.savefig(time_plot_path)
-            plt.close()
-            
-            created_files.append(time_plot_path)
+            plots.append((_plot_histogram, metrics["execution_times"], "Execution Time (s)",
+                          "Distribution of Execution Times",
+                          os.path.join(dest_dir, "execution_time_distribution.png")))
             
         # 2. Circuit Depth Distribution
         if metrics["circuit_depths"]:
-            plt.figure(figsize=(10, 6))
-            plt.hist(metrics["circuit_depths"], bins=20)
-            plt.xlabel("Circuit Depth")
-            plt.ylabel("Frequency")
-            plt.title("Distribution of Circuit Depths")
-            plt.grid(True, alpha=0.3)
-            
-            depth_plot_path = os.path.join(dest_dir, "circuit_depth_distribution.png")
-            plt.savefig(depth_plot_path)
-            plt.close()
-            
-            created_files.append(depth_plot_path)
+            plots.append((_plot_histogram, metrics["circuit_depths"], "Circuit Depth",
+                          "Distribution of Circuit Depths",
+                          os.path.join(dest_dir, "circuit_depth_distribution.png")))
             
         # 3. Gate Counts
         if metrics["gate_counts"]:
-            plt.figure(figsize=(12, 8))
-            gates = list(metrics["gate_counts"].keys())
-            counts = list(metrics["gate_counts"].values())
-            
             # Sort by count (descending)
-            sorted_data = sorted(zip(gates, counts), key=lambda x: x[1], reverse=True)
+            sorted_data = sorted(metrics["gate_counts"].items(), key=itemgetter(1), reverse=True)
             gates, counts = zip(*sorted_data)
-            
-            plt.bar(gates, counts)
-            plt.xlabel("Gate Type")
-            plt.ylabel("Count")
-            plt.title("Gate Usage Distribution")
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            
-            gates_plot_path = os.path.join(dest_dir, "gate_counts.png")
-            plt.savefig(gates_plot_path)
-            plt.close()
-            
-            created_files.append(gates_plot_path)
+            plots.append((_plot_bar, gates, counts, "Gate Type", "Gate Usage Distribution", (12, 8),
+                          os.path.join(dest_dir, "gate_counts.png")))
             
         # 4. Success vs Error rate
-        plt.figure(figsize=(8, 8))
-        plt.pie(
-            [metrics["success_rate"], metrics["error_rate"]], 
-            labels=["Success", "Error"],
-            autopct="%1.1f%%",
-            colors=["#4CAF50", "#F44336"]
-        )
-        plt.title("Success vs Error Rate")
-        
-        success_plot_path = os.path.join(dest_dir, "success_rate.png")
-        plt.savefig(success_plot_path)
-        plt.close()
-        
-        created_files.append(success_plot_path)
+        plots.append((_plot_success_rate, metrics["success_rate"], metrics["error_rate"],
+                      os.path.join(dest_dir, "success_rate.png")))
         
         # 5. Simulator/Platform Distribution
         all_platforms = metrics["simulators"] + metrics["platforms"]
         if all_platforms:
-            platform_counts = {}
-            for result in metrics["detailed_metrics"]:
-                platform = result["simulator"]
-                if platform not in platform_counts:
-                    platform_counts[platform] = 0
-                platform_counts[platform] += 1
-                
-            plt.figure(figsize=(10, 6))
-            platforms = list(platform_counts.keys())
-            counts = list(platform_counts.values())
-            
-            plt.bar(platforms, counts)
-            plt.xlabel("Simulator/Platform")
-            plt.ylabel("Count")
-            plt.title("Distribution by Simulator/Platform")
-            plt.xticks(rotation=45)
-            plt.tight_layout()
-            
-            platform_plot_path = os.path.join(dest_dir, "platform_distribution.png")
-            plt.savefig(platform_plot_path)
-            plt.close()
-            
-            created_files.append(platform_plot_path)
+            platform_counts = Counter(result["simulator"] for result in metrics["detailed_metrics"])
+            plots.append((_plot_bar, list(platform_counts.keys()), list(platform_counts.values()),
+                          "Simulator/Platform", "Distribution by Simulator/Platform", (10, 6),
+                          os.path.join(dest_dir, "platform_distribution.png")))
+            
+        created_files = None
+        cpu_count = os.cpu_count() or 1
+        if cpu_count > 1 and len(plots) >= _PARALLEL_PLOT_MIN_COUNT:
+            executor = None
+            try:
+                executor = ProcessPoolExecutor(max_workers=min(len(plots), cpu_count),
+                                               initializer=_use_agg_backend)
+                futures = [executor.submit(*plot) for plot in plots]
+            except OSError as e:
+                # No worker processes available here (e.g. a restricted sandbox)
+                logger.debug(f"Rendering plots in-process: {e}")
+                if executor is not None:
+                    executor.shutdown(cancel_futures=True)
+            else:
+                # Errors raised while rendering a plot propagate from result()
+                with executor:
+                    created_files = [future.result() for future in futures]
+        if created_files is None:
+            created_files = [plot[0](*plot[1:]) for plot in plots]
             
         logger.info(f"Created {len(created_files)} visualization plots in {dest_dir}")
         return created_files
@@ -434,7 +646,34 @@ def create_visualizations(metrics, dest_dir):
         logger.error(f"Error creating visualizations: {e}")
         return []
 
-def write_benchmark_report(metrics, visualizations, dest_file):
+def summarize_metrics(metrics):
+    """
+    Calculate the summary statistics of a benchmark report.
+    
+    Args:
+        metrics (dict): Extracted metrics
+        
+    Returns:
+        dict: Counts, success rate and the averages that have data
+    """
+    summary = {
+        "num_results": metrics["num_results"],
+        "success_rate": metrics["success_rate"],
+        "platforms_used": metrics["simulators"] + metrics["platforms"],
+        "total_shots": metrics["total_shots"]
+    }
+    
+    # Add average metrics where available
+    for key, values in (("avg_execution_time", metrics["execution_times"]),
+                        ("avg_circuit_depth", metrics["circuit_depths"]),
+                        ("avg_circuit_width", metrics["circuit_widths"]),
+                        ("avg_fidelity", metrics["distribution_fidelities"])):
+        if values:
+            summary[key] = sum(values) / len(values)
+    
+    return summary
+
+def write_benchmark_report(metrics, visualizations, dest_file, summary=None):
     """
     Write a comprehensive benchmark report.
     
@@ -442,6 +681,7 @@ def write_benchmark_report(metrics, visualizations, dest_file):
         metrics (dict): Extracted metrics
         visualizations (list): Paths to visualization files
         dest_file (str): Destination file path
+        summary (dict, optional): Result of summarize_metrics(metrics), if already computed
         
     Returns:
         bool: True if successful
@@ -454,41 +694,23 @@ def write_benchmark_report(metrics, visualizations, dest_file):
             "visualizations": [os.path.basename(v) for v in visualizations]
         }
         
-        # Calculate summary statistics
-        summary = {
-            "num_results": metrics["num_results"],
-            "success_rate": metrics["success_rate"],
-            "platforms_used": metrics["simulators"] + metrics["platforms"],
-            "total_shots": metrics["total_shots"]
-        }
-        
-        # Add average metrics where available
-        if metrics["execution_times"]:
-            summary["avg_execution_time"] = sum(metrics["execution_times"]) / len(metrics["execution_times"])
-            
-        if metrics["circuit_depths"]:
-            summary["avg_circuit_depth"] = sum(metrics["circuit_depths"]) / len(metrics["circuit_depths"])
-            
-        if metrics["circuit_widths"]:
-            summary["avg_circuit_width"] = sum(metrics["circuit_widths"]) / len(metrics["circuit_widths"])
-            
-        if metrics["distribution_fidelities"]:
-            summary["avg_fidelity"] = sum(metrics["distribution_fidelities"]) / len(metrics["distribution_fidelities"])
-            
-        report["summary"] = summary
+        report["summary"] = summary if summary is not None else summarize_metrics(metrics)
         
-        # Write JSON report
-        with open(dest_file, 'w') as f:
-            json.dump(report, f, indent=2)
+        # Write JSON report (extract_metrics already turned its sets into lists)
+        os.makedirs(os.path.dirname(dest_file) or ".", exist_ok=True)
+        _write_json(report, dest_file)
             
         # Also write a CSV file with detailed metrics
         csv_path = os.path.splitext(dest_file)[0] + ".csv"
         with open(csv_path, 'w', newline='') as f:
             if metrics["detailed_metrics"]:
-                fieldnames = metrics["detailed_metrics"][0].keys()
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
-                writer.writeheader()
-                writer.writerows(metrics["detailed_metrics"])
+                # Every row is built by extract_metrics with the same keys,
+                # so one itemgetter turns each row into a tuple in a single call
+                fieldnames = list(metrics["detailed_metrics"][0].keys())
+                row_values = itemgetter(*fieldnames)
+                writer = csv.writer(f)
+                writer.writerow(fieldnames)
+                writer.writerows(map(row_values, metrics["detailed_metrics"]))
                 
         logger.info(f"Benchmark report written to {dest_file}")
         logger.info(f"Detailed metrics CSV written to {csv_path}")
@@ -518,12 +740,15 @@ def benchmark(source_file, dest_file=None):
         return False
     
     # Determine if this is a circuit file or results file/directory
+    # A .qasm file is a circuit by its extension; only a .json file needs its
+    # first bytes checked, in case it is actually a QASM circuit
     is_circuit = False
-    if os.path.isfile(source_file) and source_file.endswith((".qasm", ".json")):
-        with open(source_file, 'r') as f:
-            content = f.read(100)  # Read first 100 chars to check
-            if content.strip().startswith("OPENQASM"):
-                is_circuit = True
+    if os.path.isfile(source_file):
+        if source_file.endswith(".qasm"):
+            is_circuit = True
+        elif source_file.endswith(".json"):
+            with open(source_file, 'rb') as f:
+                is_circuit = f.read(100).lstrip().startswith(b"OPENQASM")
     
     # Determine destination path
     if not dest_file:
@@ -558,11 +783,17 @@ def benchmark(source_file, dest_file=None):
     # Extract metrics
     metrics = extract_metrics(results)
     
-    # Create visualizations
-    visualizations = create_visualizations(metrics, viz_dir)
+    # Create visualizations, unless the results carry no timing or circuit data
+    # (e.g. bare counts files), in which case every plot would be empty
+    if metrics["execution_times"] or metrics["circuit_depths"] or metrics["gate_counts"]:
+        visualizations = create_visualizations(metrics, viz_dir)
+    else:
+        logger.warning("Results have no execution time or circuit data; skipping visualizations")
+        visualizations = []
     
     # Generate report
-    success = write_benchmark_report(metrics, visualizations, dest_file)
+    summary = summarize_metrics(metrics)
+    success = write_benchmark_report(metrics, visualizations, dest_file, summary)
     
     if success:
         logger.info(f"Benchmarking completed successfully, report at {dest_file}")
@@ -573,13 +804,11 @@ def benchmark(source_file, dest_file=None):
         logger.info(f"  - Success rate: {metrics['success_rate']:.2%}")
         logger.info(f"  - Total shots: {metrics['total_shots']}")
         
-        if metrics["execution_times"]:
-            avg_time = sum(metrics["execution_times"]) / len(metrics["execution_times"])
-            logger.info(f"  - Average execution time: {avg_time:.4f}s")
+        if "avg_execution_time" in summary:
+            logger.info(f"  - Average execution time: {summary['avg_execution_time']:.4f}s")
             
-        if metrics["circuit_depths"]:
-            avg_depth = sum(metrics["circuit_depths"]) / len(metrics["circuit_depths"])
-            logger.info(f"  - Average circuit depth: {avg_depth:.1f}")
+        if "avg_circuit_depth" in summary:
+            logger.info(f"  - Average circuit depth: {summary['avg_circuit_depth']:.1f}")
     
     return success
 
@@ -3,10 +3,22 @@ Commands for calculating execution costs on quantum hardware.
 """
 
 import json
+import os
 import sys
 from pathlib import Path
 import math
 import random
+import re
+from collections import OrderedDict
+
+# analyze_circuit() results keyed by (path, st_mtime_ns, st_size), so repeated
+# cost queries for an unchanged file skip the read and scan. Least recently
+# used entries are evicted first.
+_ANALYSIS_CACHE: OrderedDict[tuple, dict] = OrderedDict()
+_ANALYSIS_CACHE_MAX = 128
+
+# First `qreg name[n]` declaration in an OpenQASM 2 file
+_QREG_RE = re.compile(rb'qreg\s+\w+\s*\[(\d+)\]')
 
 # Sample pricing data (as of 2023) - in a real implementation, this would be updated regularly
 PRICING = {
@@ -212,39 +224,49 @@ def analyze_circuit(source):
         Dictionary with circuit characteristics
     """
     # In a real implementation, this would parse the OpenQASM file and analyze it
-    
+    try:
+        st = os.stat(source)
+        key = (os.path.abspath(source), st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = None
+    cached = _ANALYSIS_CACHE.get(key) if key is not None else None
+    if cached is not None:
+        _ANALYSIS_CACHE.move_to_end(key)
+    else:
+        cached = _analyze_circuit_uncached(source)
+        if key is not None:
+            _ANALYSIS_CACHE[key] = cached
+            if len(_ANALYSIS_CACHE) > _ANALYSIS_CACHE_MAX:
+                _ANALYSIS_CACHE.popitem(last=False)
+    return {**cached, "gates": dict(cached["gates"])}
+
+def _analyze_circuit_uncached(source):
+    """Read and scan a circuit file for analyze_circuit()."""
     # For now, return some dummy values
     # We could make this slightly more realistic by reading the file and counting qreg declarations
+    content = b""
+    num_qubits = 5  # Default
     try:
-        with open(source, 'r') as f:
+        with open(source, 'rb') as f:
             content = f.read()
-            # Very naive "analysis" - just for demonstration
-            num_qubits = 5  # Default
-            if "qreg" in content:
-                # Try to extract qubit count - this is a very simplified approach
-                for line in content.split('\n'):
-                    if "qreg" in line:
-                        try:
-                            # Try to extract number of qubits from qreg q[n];
-                            start_idx = line.find('[') + 1
-                            end_idx = line.find(']')
-                            if start_idx > 0 and end_idx > start_idx:
-                                num_qubits = int(line[start_idx:end_idx])
-                                break
-                        except:
-                            pass
-    except:
+    except OSError:
         # If file can't be read, use defaults
-        num_qubits = 5
+        pass
+    # Very naive "analysis" - just for demonstration
+    m = _QREG_RE.search(content)
+    if m:
+        num_qubits = int(m.group(1))
     
+    # Seed from the file content so the same circuit always gets the same values
+    rng = random.Random(content)
     # Generate some plausible circuit characteristics based on qubit count
     return {
         "qubits": num_qubits,
-        "depth": max(10, int(num_qubits * random.uniform(1.5, 4.0))),
+        "depth": max(10, int(num_qubits * rng.uniform(1.5, 4.0))),
         "gates": {
-            "total": max(20, int(num_qubits * random.uniform(5, 15))),
-            "single_qubit": max(10, int(num_qubits * random.uniform(3, 8))),
-            "two_qubit": max(5, int(num_qubits * random.uniform(2, 7)))
+            "total": max(20, int(num_qubits * rng.uniform(5, 15))),
+            "single_qubit": max(10, int(num_qubits * rng.uniform(3, 8))),
+            "two_qubit": max(5, int(num_qubits * rng.uniform(2, 7)))
         }
     }
 
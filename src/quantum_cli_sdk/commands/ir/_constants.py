@@ -0,0 +1,9 @@
+"""
+Constants for the IR commands that the CLI parser needs.
+
+This module must stay free of imports so that building the ``ir`` parser
+doesn't load the command implementations (and the transpiler).
+"""
+
+# Supported error mitigation techniques (maps CLI option to pass manager key)
+SUPPORTED_TECHNIQUES = ["zne", "pec", "cdr", "dd"]
@@ -14,13 +14,12 @@ from quantum_cli_sdk.transpiler import (
     parse_qasm,
     circuit_to_qasm
 )
+# Supported techniques live in an import-free module so the CLI parser can use them
+from quantum_cli_sdk.commands.ir._constants import SUPPORTED_TECHNIQUES
 
 # Set up logger
 logger = logging.getLogger(__name__)
 
-# Supported techniques (maps CLI option to pass manager key)
-SUPPORTED_TECHNIQUES = ["zne", "pec", "cdr", "dd"]
-
 def mitigate_circuit_command(args: argparse.Namespace):
     """
     Handles the 'ir mitigate' command logic.
@@ -30,7 +29,8 @@ def mitigate_circuit_command(args: argparse.Namespace):
             - input_file (str): Path to the input QASM file (often optimized).
             - output_file (str): Path to save the mitigated QASM file.
             - technique (str): Mitigation technique to apply.
-            - params (str, optional): JSON string of technique-specific parameters.
+            - params (dict or str, optional): Technique-specific parameters, either
+              already decoded by the CLI parser or as a JSON string.
             - report (bool): Whether to generate a mitigation report.
     """
     input_file = Path(args.input_file)
@@ -44,7 +44,11 @@ def mitigate_circuit_command(args: argparse.Namespace):
         
     # Parse technique-specific parameters from JSON string
     mitigation_params = {}
-    if args.params:
+    if isinstance(args.params, dict):
+        # The CLI parser has already decoded and checked --params
+        mitigation_params = args.params
+        print(f"Using custom parameters: {mitigation_params}", file=sys.stderr)
+    elif args.params:
         try:
             mitigation_params = json.loads(args.params)
             if not isinstance(mitigation_params, dict):
@@ -74,11 +74,12 @@ class ConfigManager:
         self._config_file = None
         self._active_profile = None
     
-    def load_config(self, config_file: Optional[str] = None) -> bool:
+    def load_config(self, config_file: Optional[str] = None, profile: Optional[str] = None) -> bool:
         """Load configuration from file.
         
         Args:
             config_file: Path to configuration file (optional)
+            profile: Profile to activate, taking precedence over QUANTUM_PROFILE (optional)
             
         Returns:
             True if configuration was loaded successfully, False otherwise
@@ -110,7 +111,7 @@ class ConfigManager:
         
         if config_file is None:
             logger.debug("No configuration file found, using defaults")
-            self._set_active_profile()
+            self._set_active_profile(profile)
             return False
         
         try:
@@ -127,12 +128,12 @@ class ConfigManager:
             # logger.info(f"Loaded configuration from {config_file}")
             
             # Set active profile
-            self._set_active_profile()
+            self._set_active_profile(profile)
             return True
             
         except Exception as e:
             logger.error(f"Error loading configuration from {config_file}: {e}")
-            self._set_active_profile()
+            self._set_active_profile(profile)
             return False
     
     def _update_config(self, config_data: Dict[str, Any]) -> None:
@@ -151,21 +152,21 @@ class ConfigManager:
         
         deep_update(self._config, config_data)
     
-    def _set_active_profile(self) -> None:
-        """Set the active profile based on configuration or environment."""
-        # Check environment variable first
-        env_profile = os.environ.get("QUANTUM_PROFILE")
-        if env_profile and env_profile in self._config["profiles"]:
-            self._active_profile = env_profile
+    def _set_active_profile(self, profile: Optional[str] = None) -> None:
+        """Set the active profile based on the requested profile, environment or configuration."""
+        # Check the requested profile first, then the environment variable
+        requested = profile or os.environ.get("QUANTUM_PROFILE")
+        if requested and requested in self._config["profiles"]:
+            self._active_profile = requested
         else:
             # Use profile from config
-            profile = self._config.get("profile", "dev")
-            if profile in self._config["profiles"]:
-                self._active_profile = profile
+            config_profile = self._config.get("profile", "dev")
+            if config_profile in self._config["profiles"]:
+                self._active_profile = config_profile
             else:
                 # Fall back to dev profile
                 self._active_profile = "dev"
-                logger.warning(f"Profile '{profile}' not found, using 'dev' profile")
+                logger.warning(f"Profile '{config_profile}' not found, using 'dev' profile")
     
     def save_config(self, config_file: Optional[str] = None) -> bool:
         """Save current configuration to file.
@@ -253,6 +254,19 @@ class ConfigManager:
         profile_config = self.get_profile_config(profile)
         return profile_config.get(key, default)
     
+    def get_settings(self, defaults: Dict[str, Any], profile: Optional[str] = None) -> Dict[str, Any]:
+        """Get several settings from the specified or active profile at once.
+        
+        Args:
+            defaults: Mapping of setting key to the default used when it is not set
+            profile: Profile name (optional, defaults to active profile)
+            
+        Returns:
+            Mapping of each requested key to its value or default
+        """
+        profile_config = self.get_profile_config(profile)
+        return {key: profile_config.get(key, default) for key, default in defaults.items()}
+    
     def set_setting(self, key: str, value: Any, profile: Optional[str] = None) -> None:
         """Set a configuration setting in the specified or active profile.
         
@@ -383,14 +397,15 @@ def get_config() -> ConfigManager:
     """
     return _config_manager
 
-def initialize_config(config_file: Optional[str] = None) -> ConfigManager:
+def initialize_config(config_file: Optional[str] = None, profile: Optional[str] = None) -> ConfigManager:
     """Initialize the configuration system.
     
     Args:
         config_file: Path to configuration file (optional)
+        profile: Profile to activate, taking precedence over QUANTUM_PROFILE (optional)
         
     Returns:
         ConfigManager instance
     """
-    _config_manager.load_config(config_file)
+    _config_manager.load_config(config_file, profile)
     return _config_manager 
\ No newline at end of file
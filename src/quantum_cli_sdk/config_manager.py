@@ -12,6 +12,7 @@ This module provides functionality to:
 import os
 import json
 import logging
+import functools
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 
@@ -72,6 +73,8 @@ class ConfigManager:
             with open(self.config_path, 'w') as f:
                 json.dump(self.config, f, indent=2)
             logger.info(f"Saved configuration to {self.config_path}")
+            # Saved values (including profile switches) invalidate cached lookups
+            clear_config_cache()
             return True
         except Exception as e:
             logger.error(f"Failed to save configuration: {e}")
@@ -587,6 +590,12 @@ class ConfigManager:
 
 # Convenience functions for command-line use
 
+@functools.lru_cache(maxsize=1)
+def _shared_manager() -> ConfigManager:
+    """ConfigManager used by the cached getters, so the config file is loaded once."""
+    return ConfigManager()
+
+@functools.lru_cache(maxsize=256)
 def get_config_value(path: str, default: Any = None) -> Any:
     """
     Get a configuration value by path.
@@ -598,7 +607,7 @@ def get_config_value(path: str, default: Any = None) -> Any:
     Returns:
         Configuration value
     """
-    manager = ConfigManager()
+    manager = _shared_manager()
     
     # Split path into components
     components = path.split('.')
@@ -655,6 +664,7 @@ def set_config_value(path: str, value: Any) -> bool:
         logger.error(f"Failed to set configuration value at {path}: {e}")
         return False
 
+@functools.lru_cache(maxsize=256)
 def get_default_param(command: str, param_name: str, default: Any = None) -> Any:
     """
     Get a default parameter value.
@@ -667,10 +677,16 @@ def get_default_param(command: str, param_name: str, default: Any = None) -> Any
     Returns:
         Parameter value
     """
-    manager = ConfigManager()
+    manager = _shared_manager()
     value = manager.get_default_param(command, param_name)
     return value if value is not None else default
 
+def clear_config_cache() -> None:
+    """Clear cached get_config_value/get_default_param lookups."""
+    get_config_value.cache_clear()
+    get_default_param.cache_clear()
+    _shared_manager.cache_clear()
+
 def set_default_param(command: str, param_name: str, value: Any) -> bool:
     """
     Set a default parameter value.
@@ -14,7 +14,6 @@ import os
 import json
 import uuid
 import datetime
-import requests
 import logging
 import tempfile
 from pathlib import Path
@@ -7,6 +7,8 @@ to extend the CLI's functionality without altering the core codebase.
 
 import os
 import sys
+import pickle
+import hashlib
 import logging
 import importlib.util
 from abc import ABC, abstractmethod
@@ -74,6 +76,20 @@ class TranspilerPlugin(PluginInterface):
 # Global registries for plugins
 _command_plugins: Dict[str, CommandPlugin] = {}
 _transpiler_plugins: Dict[str, Type] = {}
+_registration_count = 0
+# Every command name registered, in order (repeats included); the names a
+# plugin file provides are the ones appended while it is imported
+_registered_command_names: List[str] = []
+
+# Remembers which files in the plugin directories register plugins, and
+# which command names each of them provides
+PLUGIN_CACHE_FILE = os.path.expanduser("~/.quantum-cli/.plugin-cache.pkl")
+# Bumped whenever the layout of the cached file list changes
+_PLUGIN_CACHE_VERSION = 4
+# Plugin files skipped by a discover_plugins() call for a single command.
+# They are loaded the first time the command registry is listed, so callers
+# of get_registered_command_plugins() always see every plugin.
+_deferred_plugin_files: List[str] = []
 
 
 def register_command_plugin(plugin: CommandPlugin) -> None:
@@ -82,7 +98,10 @@ def register_command_plugin(plugin: CommandPlugin) -> None:
     Args:
         plugin: The command plugin to register
     """
+    global _registration_count
     name = plugin.name
+    _registration_count += 1
+    _registered_command_names.append(name)
     if name in _command_plugins:
         logger.warning(f"Command plugin '{name}' is already registered, overwriting")
     
@@ -96,7 +115,9 @@ def register_transpiler_plugin(plugin_class: Type) -> None:
     Args:
         plugin_class: The transpiler plugin class to register
     """
+    global _registration_count
     name = plugin_class.__name__
+    _registration_count += 1
     if name in _transpiler_plugins:
         logger.warning(f"Transpiler plugin '{name}' is already registered, overwriting")
     
@@ -107,9 +128,13 @@ def register_transpiler_plugin(plugin_class: Type) -> None:
 def get_registered_command_plugins() -> Dict[str, CommandPlugin]:
     """Get all registered command plugins.
     
+    Plugin files skipped by a command-specific discover_plugins() call are
+    loaded first.
+    
     Returns:
         Dictionary of command name to plugin
     """
+    _load_deferred_plugins()
     return _command_plugins
 
 
@@ -122,20 +147,120 @@ def get_registered_transpiler_plugins() -> Dict[str, Type]:
     return _transpiler_plugins
 
 
-def discover_plugins(plugin_dirs: Optional[List[str]] = None) -> int:
+def _plugin_cache_key(file_stamps: List[tuple]) -> str:
+    """Build a cache key from (file, mtime_ns) pairs."""
+    return hashlib.sha1(repr(file_stamps).encode()).hexdigest()
+
+
+def _read_plugin_cache(key: str) -> Optional[List[tuple]]:
+    """Return the cached (plugin file, command names) list if it was stored under key."""
+    try:
+        with open(PLUGIN_CACHE_FILE, "rb") as f:
+            cached = pickle.load(f)
+    except Exception:
+        return None
+    if (not isinstance(cached, dict) or cached.get("version") != _PLUGIN_CACHE_VERSION
+            or cached.get("key") != key):
+        return None
+    return cached.get("files")
+
+
+def _write_plugin_cache(key: str, plugin_files: List[tuple]) -> None:
+    """Store the (plugin file, command names) list under key.
+
+    The data is written to a temporary file next to PLUGIN_CACHE_FILE and
+    renamed over it, so concurrent readers never see a partial file.
+    """
+    tmp_path = f"{PLUGIN_CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(PLUGIN_CACHE_FILE), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"version": _PLUGIN_CACHE_VERSION, "key": key, "files": plugin_files}, f)
+        os.replace(tmp_path, PLUGIN_CACHE_FILE)
+    except Exception as e:
+        logger.debug(f"Could not write plugin cache: {e}")
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _load_plugin_module(plugin_path: str) -> bool:
+    """Import a plugin file, returning True if it registered at least one plugin."""
+    registered_before = _registration_count
+    try:
+        # Import the module
+        module_name = os.path.splitext(os.path.basename(plugin_path))[0]
+        spec = importlib.util.spec_from_file_location(module_name, plugin_path)
+        if spec is None or spec.loader is None:
+            logger.warning(f"Failed to load plugin: {plugin_path}")
+            return False
+
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    except Exception as e:
+        logger.error(f"Error loading plugin {plugin_path}: {e}")
+        return False
+
+    # The plugin should register itself using register_command_plugin
+    # or register_transpiler_plugin
+    if _registration_count == registered_before:
+        return False
+    logger.info(f"Loaded plugin: {plugin_path}")
+    return True
+
+
+def _cached_files_for_command(cached_files: List[tuple], command: Optional[str]) -> tuple:
+    """Split the cached plugin files into those needed to run command and the rest.
+
+    The needed files are the one registering the command plus any files that
+    register no commands (transpiler plugins). If command is None or no
+    cached file provides it, every cached file is needed.
+    """
+    if command is not None and any(command in names for _, names in cached_files):
+        needed = [path for path, names in cached_files if command in names or not names]
+        deferred = [path for path, names in cached_files if names and command not in names]
+        return needed, deferred
+    return [path for path, _ in cached_files], []
+
+
+def _load_deferred_plugins() -> None:
+    """Load the plugin files a command-specific discover_plugins() call skipped."""
+    while _deferred_plugin_files:
+        _load_plugin_module(_deferred_plugin_files.pop(0))
+
+
+def discover_plugins(plugin_dirs: Optional[List[str]] = None, use_cache: bool = True,
+                     command: Optional[str] = None) -> int:
     """Discover and load plugins from specified directories.
     
+    Which files register plugins, and the command names they provide, is
+    cached in PLUGIN_CACHE_FILE, keyed by the path and modification time of
+    every candidate file. Unchanged directories only import their plugin
+    files instead of every module they contain. If command is given, a cache
+    hit only imports the file providing it (and transpiler-only files); the
+    other command plugins are loaded when get_registered_command_plugins()
+    is first called. Pass command=None when every plugin has to be
+    registered up front, e.g. to list them in help output.
+    
     Args:
         plugin_dirs: List of directory paths to look for plugins (defaults to current directory)
+        use_cache: Whether to use the plugin discovery cache
+        command: Command about to be run; other command plugins are deferred on a cache hit
         
     Returns:
-        Number of plugins loaded
+        Number of plugin files imported by this call that registered at least
+        one plugin. Modules that register nothing are not counted, and neither
+        are deferred files.
     """
     if plugin_dirs is None:
         plugin_dirs = [os.getcwd()]
     
-    # Normalize and expand paths
-    normalized_dirs = []
+    # Collect candidate files with their mtimes. Listing a directory is
+    # cheap next to importing its modules, and keying on file mtimes (not
+    # just the directory's) also catches files edited in place.
+    candidates = []
     for path in plugin_dirs:
         # Expand ~ to home directory
         if path.startswith("~"):
@@ -144,42 +269,42 @@ def discover_plugins(plugin_dirs: Optional[List[str]] = None) -> int:
         # Convert to absolute path
         path = os.path.abspath(path)
         
-        if os.path.isdir(path):
-            normalized_dirs.append(path)
-        else:
+        try:
+            entries = os.scandir(path)
+        except (FileNotFoundError, NotADirectoryError):
             logger.warning(f"Plugin directory not found: {path}")
-    
-    count = 0
-    for plugin_dir in normalized_dirs:
-        logger.debug(f"Searching for plugins in {plugin_dir}")
+            continue
+        
+        logger.debug(f"Searching for plugins in {path}")
         
         # Only look for .py files directly in the directory
-        for filename in os.listdir(plugin_dir):
-            if not filename.endswith(".py") or filename.startswith("_"):
-                continue
-            
-            plugin_path = os.path.join(plugin_dir, filename)
-            try:
-                # Import the module
-                module_name = os.path.splitext(filename)[0]
-                spec = importlib.util.spec_from_file_location(module_name, plugin_path)
-                if spec is None or spec.loader is None:
-                    logger.warning(f"Failed to load plugin: {plugin_path}")
+        with entries:
+            for entry in entries:
+                if not entry.name.endswith(".py") or entry.name.startswith("_") or not entry.is_file():
+                    continue
+                try:
+                    candidates.append((entry.path, entry.stat().st_mtime_ns))
+                except OSError:
                     continue
-                
-                module = importlib.util.module_from_spec(spec)
-                sys.modules[module_name] = module
-                spec.loader.exec_module(module)
-                
-                # The plugin should register itself using register_command_plugin
-                # or register_transpiler_plugin
-                count += 1
-                logger.info(f"Loaded plugin: {plugin_path}")
-                
-            except Exception as e:
-                logger.error(f"Error loading plugin {plugin_path}: {e}")
-    
-    return count
+    
+    cache_key = _plugin_cache_key(candidates)
+    cached_files = _read_plugin_cache(cache_key) if use_cache else None
+    if cached_files is not None:
+        logger.debug("Using cached plugin file list")
+        needed, deferred = _cached_files_for_command(cached_files, command)
+        _deferred_plugin_files[:] = deferred
+        return sum(_load_plugin_module(plugin_path) for plugin_path in needed)
+    
+    _deferred_plugin_files.clear()    
+    plugin_files = []
+    for plugin_path, _ in candidates:
+        # Names the file registers, including ones that were already registered
+        names_before = len(_registered_command_names)
+        if _load_plugin_module(plugin_path):
+            plugin_files.append((plugin_path, sorted(set(_registered_command_names[names_before:]))))
+    
+    _write_plugin_cache(cache_key, plugin_files)
+    return len(plugin_files)
 
 
 def setup_plugin_subparsers(subparsers):
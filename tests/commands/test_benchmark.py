@@ -0,0 +1,254 @@
+"""
+Tests for the benchmark command.
+"""
+
+import json
+from concurrent.futures import Future
+
+import pytest
+
+from quantum_cli_sdk.commands import benchmark as benchmark_mod
+
+
+@pytest.fixture
+def plot_calls(monkeypatch):
+    """Record create_visualizations() calls instead of rendering plots."""
+    calls = []
+    monkeypatch.setattr(benchmark_mod, "create_visualizations",
+                        lambda metrics, dest_dir: calls.append(metrics) or [])
+    return calls
+
+
+def write_result(path, **fields):
+    path.write_text(json.dumps({"counts": {"00": 512, "11": 488}, "success": True, **fields}))
+    return str(path)
+
+
+def test_benchmark_skips_plots_for_bare_counts(tmp_path, plot_calls):
+    source = write_result(tmp_path / "counts.json")
+    report = tmp_path / "report" / "benchmark.json"
+
+    assert benchmark_mod.benchmark(source, str(report))
+    assert plot_calls == []
+    assert json.loads(report.read_text())["visualizations"] == []
+
+
+@pytest.mark.parametrize("fields", [
+    {"execution_time": 0.0},
+    {"circuit_metrics": {"depth": 0, "width": 0}},
+])
+def test_benchmark_plots_zero_valued_data(tmp_path, plot_calls, fields):
+    # A measured zero is still data and gets plotted
+    source = write_result(tmp_path / "result.json", **fields)
+
+    assert benchmark_mod.benchmark(source, str(tmp_path / "benchmark.json"))
+    assert len(plot_calls) == 1
+
+
+class FakeCircuit:
+    """Stands in for a QuantumCircuit and counts how often it is measured."""
+
+    num_qubits = 2
+
+    def __init__(self):
+        self.measured = 0
+
+    def count_ops(self):
+        self.measured += 1
+        return {"h": 1, "cx": 1, "measure": 2}
+
+    def depth(self):
+        return 3
+
+
+@pytest.fixture
+def metrics_cache(tmp_path, monkeypatch):
+    """Point the circuit metrics cache at tmp_path and start with nothing loaded."""
+    path = tmp_path / "circuit-metrics.json"
+    monkeypatch.setattr(benchmark_mod, "_CIRCUIT_METRICS_CACHE", str(path))
+    monkeypatch.setattr(benchmark_mod, "_circuit_metrics_changed", False)
+    benchmark_mod._circuit_metrics_cache.cache_clear()
+    yield path
+    benchmark_mod._circuit_metrics_cache.cache_clear()
+
+
+def cached_entries(path):
+    return json.loads(path.read_text())["entries"]
+
+
+BELL_QASM = 'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[2];\nh q[0];\ncx q[0], q[1];\n'
+
+
+def test_circuit_metrics_cache_hit(metrics_cache):
+    circuit = FakeCircuit()
+    first = benchmark_mod._circuit_metrics(circuit, BELL_QASM)
+    assert circuit.measured == 1
+    benchmark_mod._save_circuit_metrics_cache()
+
+    # A new process reads the sidecar file instead of measuring again
+    benchmark_mod._circuit_metrics_cache.cache_clear()
+    second = benchmark_mod._circuit_metrics(circuit, BELL_QASM)
+    assert circuit.measured == 1
+    assert second == first == {
+        "qubits": 2,
+        "depth": 3,
+        "gates": {"total": 4, "single_qubit": 1, "two_qubit": 1,
+                  "by_type": {"h": 1, "cx": 1, "measure": 2}},
+    }
+
+    # Callers get a copy they can modify without changing the cache
+    second["gates"]["by_type"]["h"] = 99
+    assert benchmark_mod._circuit_metrics(circuit, BELL_QASM)["gates"]["by_type"]["h"] == 1
+
+
+def test_circuit_metrics_cache_miss_on_changed_qasm(metrics_cache):
+    circuit = FakeCircuit()
+    benchmark_mod._circuit_metrics(circuit, BELL_QASM)
+    benchmark_mod._circuit_metrics(circuit, BELL_QASM + "x q[1];\n")
+    assert circuit.measured == 2
+    benchmark_mod._save_circuit_metrics_cache()
+    assert len(cached_entries(metrics_cache)) == 2
+
+
+def test_circuit_metrics_cache_miss_after_qiskit_upgrade(metrics_cache, monkeypatch):
+    circuit = FakeCircuit()
+    benchmark_mod._circuit_metrics(circuit, BELL_QASM)
+    benchmark_mod._save_circuit_metrics_cache()
+
+    monkeypatch.setattr(benchmark_mod, "_qiskit_version", lambda: "99.0.0")
+    benchmark_mod._circuit_metrics_cache.cache_clear()
+    benchmark_mod._circuit_metrics(circuit, BELL_QASM)
+    assert circuit.measured == 2
+
+
+def test_circuit_metrics_cache_evicts_oldest_at_cap(metrics_cache, monkeypatch):
+    monkeypatch.setattr(benchmark_mod, "_CIRCUIT_METRICS_CACHE_MAX_ENTRIES", 2)
+    circuit = FakeCircuit()
+    sources = [BELL_QASM + f"// {i}\n" for i in range(3)]
+    for qasm in sources:
+        benchmark_mod._circuit_metrics(circuit, qasm)
+    benchmark_mod._save_circuit_metrics_cache()
+    assert len(cached_entries(metrics_cache)) == 2
+
+    benchmark_mod._circuit_metrics_cache.cache_clear()
+    benchmark_mod._circuit_metrics(circuit, sources[2])
+    assert circuit.measured == 3
+    benchmark_mod._circuit_metrics(circuit, sources[0])
+    assert circuit.measured == 4
+
+
+def test_circuit_metrics_cache_recovers_from_corrupt_file(metrics_cache):
+    metrics_cache.write_text("{not json")
+    circuit = FakeCircuit()
+    assert benchmark_mod._circuit_metrics(circuit, BELL_QASM)["depth"] == 3
+    assert circuit.measured == 1
+    # The corrupt file is replaced by a valid one
+    benchmark_mod._save_circuit_metrics_cache()
+    assert len(cached_entries(metrics_cache)) == 1
+
+
+def test_run_benchmarks_writes_metrics_cache_once(metrics_cache, monkeypatch):
+    writes = []
+    write_json = benchmark_mod._write_json
+    monkeypatch.setattr(benchmark_mod, "_write_json",
+                        lambda data, path: writes.append(path) or write_json(data, path))
+    monkeypatch.setattr(benchmark_mod, "_run_benchmark",
+                        lambda path, shots: benchmark_mod._circuit_metrics(FakeCircuit(), path))
+
+    results = benchmark_mod.run_benchmarks([BELL_QASM + f"// {i}\n" for i in range(4)])
+    assert len(results) == 4
+    assert len(writes) == 1
+    assert len(cached_entries(metrics_cache)) == 4
+
+    # Nothing new to save, so the file is not rewritten
+    benchmark_mod.run_benchmarks([BELL_QASM + "// 0\n"])
+    assert len(writes) == 1
+
+
+@pytest.fixture
+def rendered(monkeypatch):
+    """Record in-process plot rendering instead of drawing with matplotlib."""
+    calls = []
+    for name in ("_plot_histogram", "_plot_bar", "_plot_success_rate"):
+        monkeypatch.setattr(benchmark_mod, name, lambda *args: calls.append(args) or args[-1])
+    return calls
+
+
+def plot_metrics(num_results):
+    results = [{"counts": {"0": 1}, "success": True, "simulator": "qiskit", "execution_time": 0.1,
+                "circuit_metrics": {"depth": 2, "width": 1, "gate_counts": {"h": 1}}}
+               for _ in range(num_results)]
+    return benchmark_mod.extract_metrics(results)
+
+
+class FailingFutureExecutor:
+    """A pool whose plots all fail while rendering."""
+
+    def __init__(self, **kwargs):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, func, *args):
+        future = Future()
+        future.set_exception(PermissionError("cannot write plot"))
+        return future
+
+
+def test_create_visualizations_renders_few_plots_in_process(tmp_path, monkeypatch, rendered):
+    def no_pool(**kwargs):
+        raise AssertionError("pool started for too few plots")
+
+    monkeypatch.setattr(benchmark_mod.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(benchmark_mod, "ProcessPoolExecutor", no_pool)
+    metrics = {**plot_metrics(1), "execution_times": [], "circuit_depths": [], "gate_counts": {}}
+
+    created = benchmark_mod.create_visualizations(metrics, str(tmp_path))
+    assert len(created) == len(rendered) < benchmark_mod._PARALLEL_PLOT_MIN_COUNT
+
+
+def test_create_visualizations_falls_back_without_worker_processes(tmp_path, monkeypatch, rendered):
+    def no_processes(**kwargs):
+        raise OSError("no semaphores")
+
+    monkeypatch.setattr(benchmark_mod.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(benchmark_mod, "ProcessPoolExecutor", no_processes)
+
+    created = benchmark_mod.create_visualizations(plot_metrics(3), str(tmp_path))
+    assert len(created) == len(rendered) == 5
+
+
+def test_create_visualizations_does_not_hide_plot_errors(tmp_path, monkeypatch, rendered, caplog):
+    monkeypatch.setattr(benchmark_mod.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(benchmark_mod, "ProcessPoolExecutor", FailingFutureExecutor)
+
+    assert benchmark_mod.create_visualizations(plot_metrics(3), str(tmp_path)) == []
+    # The failure is reported instead of being retried in-process
+    assert rendered == []
+    assert "cannot write plot" in caplog.text
+
+
+def test_run_benchmark_without_aer_returns_none(tmp_path, monkeypatch, caplog):
+    def no_aer():
+        raise ImportError("No module named 'qiskit_aer'")
+
+    monkeypatch.setattr(benchmark_mod, "_aer_simulator", no_aer)
+    source = tmp_path / "bell.qasm"
+    source.write_text(BELL_QASM)
+    assert benchmark_mod.run_benchmark(str(source)) is None
+    assert "qiskit_aer" in caplog.text
+
+
+def test_run_benchmark_runs_circuit(tmp_path, metrics_cache):
+    pytest.importorskip("qiskit_aer")
+    source = tmp_path / "bell.qasm"
+    source.write_text(BELL_QASM + "creg c[2];\nmeasure q -> c;\n")
+
+    result = benchmark_mod.run_benchmark(str(source), shots=16)
+    assert result["circuit"]["name"] == "bell"
+    assert result["execution"]["shots"] == 16
+    assert result["metrics"]["success"]
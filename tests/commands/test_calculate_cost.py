@@ -0,0 +1,68 @@
+"""
+Tests for the cost calculation command.
+"""
+
+import os
+
+import pytest
+
+from quantum_cli_sdk.commands import calculate_cost as cost_mod
+
+
+@pytest.fixture
+def analysis_calls(monkeypatch):
+    """Start with an empty analysis cache and count uncached analyses."""
+    calls = []
+    analyze = cost_mod._analyze_circuit_uncached
+    monkeypatch.setattr(cost_mod, "_ANALYSIS_CACHE", cost_mod.OrderedDict())
+    monkeypatch.setattr(cost_mod, "_analyze_circuit_uncached",
+                        lambda source: calls.append(source) or analyze(source))
+    return calls
+
+
+def write_circuit(path, num_qubits):
+    path.write_text(f'OPENQASM 2.0;\ninclude "qelib1.inc";\nqreg q[{num_qubits}];\nh q[0];\n')
+    return str(path)
+
+
+def test_analyze_circuit_cache_hit(tmp_path, analysis_calls):
+    source = write_circuit(tmp_path / "circuit.qasm", 3)
+    first = cost_mod.analyze_circuit(source)
+    first["gates"]["total"] = -1
+
+    second = cost_mod.analyze_circuit(source)
+    assert len(analysis_calls) == 1
+    assert second["qubits"] == 3
+    # Callers get a copy they can modify without changing the cache
+    assert second["gates"]["total"] > 0
+
+
+@pytest.mark.parametrize("change", ["size", "mtime"])
+def test_analyze_circuit_cache_invalidated_by_file_change(tmp_path, analysis_calls, change):
+    path = tmp_path / "circuit.qasm"
+    source = write_circuit(path, 3)
+    cost_mod.analyze_circuit(source)
+
+    if change == "size":
+        write_circuit(path, 12)
+    else:
+        st = os.stat(source)
+        os.utime(source, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    result = cost_mod.analyze_circuit(source)
+    assert len(analysis_calls) == 2
+    assert result["qubits"] == (12 if change == "size" else 3)
+
+
+def test_analyze_circuit_cache_evicts_least_recently_used(tmp_path, analysis_calls, monkeypatch):
+    monkeypatch.setattr(cost_mod, "_ANALYSIS_CACHE_MAX", 2)
+    a, b, c = (write_circuit(tmp_path / f"{name}.qasm", 2) for name in "abc")
+    cost_mod.analyze_circuit(a)
+    cost_mod.analyze_circuit(b)
+    cost_mod.analyze_circuit(a)  # a is now more recent than b
+    cost_mod.analyze_circuit(c)  # evicts b
+
+    cost_mod.analyze_circuit(a)
+    assert analysis_calls == [a, b, c]
+    cost_mod.analyze_circuit(b)
+    assert analysis_calls == [a, b, c, b]
@@ -0,0 +1,92 @@
+"""
+Tests for the Qiskit backend selection of the generated example service.
+"""
+
+import atexit
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("fastapi")
+
+SERVICE_APP = (Path(__file__).resolve().parents[2] / "services" / "generated"
+               / "shors_factoring_15_compatible_mitigated_zne" / "app.py")
+
+
+class FakeBackend:
+    def __init__(self, name, **options):
+        self.name = name
+        self.options = dict(options)
+
+    def set_options(self, **options):
+        self.options.update(options)
+
+
+class FakeAer:
+    """Hands out one shared backend per name, like qiskit's Aer provider."""
+
+    def __init__(self, devices):
+        self.devices = devices
+        self.backends = {}
+
+    def get_backend(self, name):
+        backend = self.backends.setdefault(name, FakeBackend(name))
+        backend.available_devices = lambda: self.devices
+        return backend
+
+
+class FakeCircuit:
+    def __init__(self, num_qubits):
+        self.num_qubits = num_qubits
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    """Import the service app in tmp_path (it creates its log and job directories there)."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("FORCE_CPU_BACKEND", raising=False)
+    spec = importlib.util.spec_from_file_location("generated_service_app", SERVICE_APP)
+    app = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(app)
+
+    aer_module = types.ModuleType("qiskit.providers.aer")
+    aer_module.AerSimulator = lambda **options: FakeBackend("aer_simulator", **options)
+    monkeypatch.setitem(sys.modules, "qiskit.providers.aer", aer_module)
+    yield app
+    atexit.unregister(app.log_listener.stop)
+    app.log_listener.stop()
+
+
+def test_large_circuit_gets_a_separate_gpu_backend(service, monkeypatch):
+    aer = FakeAer(devices=("CPU", "GPU"))
+    monkeypatch.setattr(service, "Aer", aer, raising=False)
+
+    backend = service.select_qiskit_backend(FakeCircuit(service.GPU_QUBIT_THRESHOLD))
+    assert backend.options == {"method": "statevector", "device": "GPU", "cuStateVec_enable": True}
+    # The shared Aer backends keep their CPU options
+    assert all(not b.options for b in aer.backends.values())
+
+    small = service.select_qiskit_backend(FakeCircuit(service.GPU_QUBIT_THRESHOLD - 1))
+    assert small is aer.backends["qasm_simulator"]
+
+
+def test_cpu_backend_without_gpu(service, monkeypatch):
+    aer = FakeAer(devices=("CPU",))
+    monkeypatch.setattr(service, "Aer", aer, raising=False)
+
+    backend = service.select_qiskit_backend(FakeCircuit(service.GPU_QUBIT_THRESHOLD))
+    assert backend is aer.backends["qasm_simulator"]
+
+
+def test_env_var_forces_cpu_backend(service, monkeypatch):
+    aer = FakeAer(devices=("CPU", "GPU"))
+    monkeypatch.setattr(service, "Aer", aer, raising=False)
+    circuit = FakeCircuit(service.GPU_QUBIT_THRESHOLD)
+    assert service.select_qiskit_backend(circuit).options["device"] == "GPU"
+
+    # Takes effect although gpu_available() has already been cached as True
+    monkeypatch.setenv("FORCE_CPU_BACKEND", "1")
+    assert service.select_qiskit_backend(circuit) is aer.backends["qasm_simulator"]
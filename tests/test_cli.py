@@ -0,0 +1,274 @@
+"""
+Tests for the command-line entry point.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from quantum_cli_sdk import __version__
+from quantum_cli_sdk import cli
+
+
+@pytest.fixture
+def cli_env(tmp_path, monkeypatch):
+    """Run the CLI in an empty directory with its parser cache under tmp_path."""
+    monkeypatch.setattr(cli, "_PARSER_CACHE_DIR", str(tmp_path / "parser-cache"))
+    monkeypatch.setattr(cli, "_sdk_config", None)
+    monkeypatch.setattr(cli, "_sdk_profile", None)
+    monkeypatch.setattr(cli, "_transpiler_initialized", False)
+    monkeypatch.setattr(cli, "_all_plugins_loaded", False)
+    monkeypatch.setattr(cli, "_plugin_commands_loaded", set())
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_main_version_returns_zero(cli_env, capsys):
+    assert cli.main(["--version"]) == 0
+    assert __version__ in capsys.readouterr().out
+
+
+def test_main_without_command_returns_one(cli_env, capsys):
+    assert cli.main([]) == 1
+    assert "usage:" in capsys.readouterr().err
+
+
+def test_main_help_returns_zero(cli_env, capsys):
+    # The second run is served from the help cache written by the first
+    assert cli.main(["--help"]) == 0
+    first = capsys.readouterr().out
+    assert cli.main(["--help"]) == 0
+    assert capsys.readouterr().out == first
+
+
+def test_main_returns_handler_failure(cli_env, capsys):
+    assert cli.main(["analyze", "cost", str(cli_env / "missing.qasm")]) == 1
+    assert "Input file not found" in capsys.readouterr().err
+
+
+def test_main_returns_exit_code_of_exiting_command(cli_env):
+    # ir mitigate reports failure with sys.exit(); main() still returns the code
+    args = ["ir", "mitigate", "--input-file", str(cli_env / "missing.qasm"),
+            "--output-file", str(cli_env / "out.qasm"), "--technique", "zne"]
+    assert cli.main(args) == 1
+
+
+@pytest.mark.parametrize("argv", [
+    ["hub"],
+    ["version", "init"],
+    ["share", "list"],
+    ["jobs", "list"],
+    ["deps", "check"],
+])
+def test_main_returns_one_for_unimplemented_group(cli_env, capsys, argv):
+    assert cli.main(argv) == 1
+    assert "not fully implemented" in capsys.readouterr().err
+    # Unexpanded config paths must not turn into a literal ./~ directory
+    assert not (cli_env / "~").exists()
+
+
+class _StubConfig:
+    def get_plugin_paths(self):
+        return []
+
+    def get_setting(self, key, default=None):
+        return default
+
+
+@pytest.fixture
+def fresh_sdk_state(monkeypatch, tmp_path):
+    """Reset what initialize_sdk() has set up and record the parts it runs."""
+    calls = []
+    monkeypatch.setattr(cli, "_sdk_config", None)
+    monkeypatch.setattr(cli, "_sdk_profile", None)
+    monkeypatch.setattr(cli, "_transpiler_initialized", False)
+    monkeypatch.setattr(cli, "_all_plugins_loaded", False)
+    monkeypatch.setattr(cli, "_plugin_commands_loaded", set())
+    monkeypatch.setattr(cli, "_initialize_config_and_cache",
+                        lambda profile=None: calls.append(("config", profile)) or _StubConfig())
+    monkeypatch.setattr("quantum_cli_sdk.transpiler.initialize_transpiler",
+                        lambda: calls.append("transpiler"))
+    monkeypatch.setattr("quantum_cli_sdk.plugin_system.discover_plugins",
+                        lambda paths, use_cache=True, command=None: calls.append(("plugins", command)) or 0)
+    monkeypatch.chdir(tmp_path)
+    return calls
+
+
+def test_initialize_sdk_adds_parts_skipped_by_earlier_calls(fresh_sdk_state):
+    config = cli.initialize_sdk(need_transpiler=False, need_plugins=False)
+    assert fresh_sdk_state == [("config", None)]
+
+    assert cli.initialize_sdk(need_transpiler=True, need_plugins=True) is config
+    assert fresh_sdk_state == [("config", None), "transpiler", ("plugins", None)]
+
+    # Everything is already set up, including plugins for any command
+    cli.initialize_sdk(need_transpiler=True, need_plugins=True, command="myplugin")
+    assert fresh_sdk_state == [("config", None), "transpiler", ("plugins", None)]
+
+
+def test_initialize_sdk_reloads_config_for_another_profile(fresh_sdk_state):
+    cli.initialize_sdk(need_transpiler=False, need_plugins=False, profile="test")
+    cli.initialize_sdk(need_transpiler=False, need_plugins=False, profile="test")
+    cli.initialize_sdk(need_transpiler=False, need_plugins=False)
+    assert fresh_sdk_state == [("config", "test"), ("config", None)]
+
+
+def test_initialize_sdk_loads_all_plugins_after_a_single_command(fresh_sdk_state):
+    cli.initialize_sdk(need_transpiler=False, command="myplugin")
+    cli.initialize_sdk(need_transpiler=False, command="myplugin")
+    cli.initialize_sdk(need_transpiler=False)
+    assert fresh_sdk_state == [("config", None), ("plugins", "myplugin"), ("plugins", None)]
+
+
+@pytest.fixture
+def cache_env(cli_env, monkeypatch):
+    """cli_env with the home directory and its config files under tmp_path."""
+    home = cli_env / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+    monkeypatch.delenv("QUANTUM_PROFILE", raising=False)
+    monkeypatch.delenv("QUANTUM_CONFIG", raising=False)
+    monkeypatch.setattr(cli, "_DEFAULTS_CONFIG_FILE", str(home / ".quantum-cli" / "config.json"))
+    return cli_env
+
+
+@pytest.mark.parametrize("argv", [
+    ["analyze", "cost", "circuit.qasm"],
+    ["analyze", "cost", "circuit.qasm", "--platform", "ibm", "--shots", "10", "--format", "json"],
+])
+def test_cached_parser_round_trip(cache_env, argv):
+    built = cli._build_parser("analyze")
+    cli._save_cached_parser("analyze", "default", built)
+    loaded = cli._load_cached_parser("analyze", "default")
+
+    assert loaded is not None and loaded is not built
+    parsed = vars(loaded.parse_args(argv))
+    assert parsed == vars(built.parse_args(argv))
+    # SUPPRESS defaults (e.g. the -h actions) still keep their dest out of the namespace
+    assert argparse.SUPPRESS not in parsed
+
+
+def test_parser_cache_invalidated_by_profile_and_config(cache_env):
+    cli._save_cached_parser("analyze", "default", cli._build_parser("analyze"))
+    assert cli._load_cached_parser("analyze", "default") is not None
+    assert cli._load_cached_parser("analyze", "dev") is None
+
+    # Project-level config in the working directory
+    (cache_env / "quantum_config.yaml").write_text("active_profile: dev\n")
+    assert cli._load_cached_parser("analyze", "default") is None
+
+    cli._save_cached_parser("analyze", "default", cli._build_parser("analyze"))
+    config_file = Path(cli._DEFAULTS_CONFIG_FILE)
+    config_file.parent.mkdir(parents=True, exist_ok=True)
+    config_file.write_text("{}")
+    assert cli._load_cached_parser("analyze", "default") is None
+
+
+def test_help_cache_invalidated_by_profile_and_config(cache_env, monkeypatch):
+    cli._save_cached_help("default", "usage: quantum-cli\n")
+    assert cli._load_cached_help("default") == "usage: quantum-cli\n"
+    assert cli._load_cached_help("dev") is None
+
+    (cache_env / "home" / ".quantum_config.json").write_text("{}")
+    assert cli._load_cached_help("default") is None
+
+
+def test_main_help_cache_follows_quantum_profile(cache_env, monkeypatch):
+    cli._save_cached_help("default", "cached help\n")
+    monkeypatch.setenv("QUANTUM_PROFILE", "dev")
+    assert cli._resolved_profile() == "dev"
+    assert cli._resolved_profile("staging") == "staging"
+    assert cli._load_cached_help(cli._resolved_profile()) is None
+
+
+def test_failed_cache_write_keeps_previous_file(cache_env, monkeypatch):
+    cli._save_cached_help("default", "old help\n")
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(cli.os, "replace", fail_replace)
+        cli._save_cached_help("default", "new help\n")
+
+    # The temporary file is removed and readers still see the complete old file
+    assert os.listdir(cli._PARSER_CACHE_DIR) == ["_help.pkl"]
+    assert cli._load_cached_help("default") == "old help\n"
+
+
+def test_main_keys_parser_cache_on_preparsed_profile(cache_env, monkeypatch):
+    cli.main(["--profile", "dev", "analyze", "cost", str(cache_env / "missing.qasm")])
+    assert cli._load_cached_parser("analyze", "dev") is not None
+    assert cli._load_cached_parser("analyze", "default") is None
+
+
+def test_main_profile_does_not_leak_into_later_calls(cache_env, capsys):
+    from quantum_cli_sdk.config import get_config
+
+    assert cli.main(["--profile", "test", "config", "get", "shots"]) == 0
+    assert capsys.readouterr().out == "4096\n"
+    assert get_config().get_active_profile() == "test"
+    assert "QUANTUM_PROFILE" not in os.environ
+
+    # A later call without --profile is back on the config's own profile
+    cli.main(["analyze", "cost", str(cache_env / "missing.qasm")])
+    assert get_config().get_active_profile() == "dev"
+    assert cli._resolved_profile() == "default"
+
+
+class _ProfileConfig(_StubConfig):
+    def get_active_profile(self):
+        return "default"
+
+
+@pytest.mark.parametrize("argv, plugin_command", [
+    (["myplugin"], "myplugin"),
+    (["myplugin", "--help"], None),
+    (["myplugin", "-h"], None),
+])
+def test_main_loads_all_plugins_for_help(cli_env, monkeypatch, argv, plugin_command):
+    calls = []
+    monkeypatch.delenv("QUANTUM_SKIP_PLUGINS", raising=False)
+    monkeypatch.setattr(cli, "initialize_sdk", lambda **kwargs: calls.append(kwargs) or _ProfileConfig())
+    # No plugin provides the command here, so parsing stops with a usage error
+    with pytest.raises(SystemExit):
+        cli.main(argv)
+    assert calls[0]["need_plugins"] and calls[0]["command"] == plugin_command
+
+
+def test_init_list_shows_project_templates_only(cli_env, monkeypatch, capsys):
+    monkeypatch.delitem(sys.modules, "quantum_cli_sdk.commands.init", raising=False)
+
+    assert cli.main(["init", "list"]) == 0
+    assert capsys.readouterr().out == (
+        "Available templates:\n  - quantum_app: Standard Quantum Application (default)\n")
+    assert "quantum_cli_sdk.commands.init" not in sys.modules
+
+
+@pytest.mark.parametrize("command", ["version", "share", "jobs"])
+def test_building_parsers_does_not_read_config(cli_env, monkeypatch, command):
+    def no_config(*args):
+        raise AssertionError("config read while building the parser")
+
+    monkeypatch.setattr(cli, "_default_param", no_config)
+    monkeypatch.setattr(cli, "_config_value", no_config)
+    cli._build_parser(command)
+
+
+def test_config_defaults_fill_omitted_options(cli_env, monkeypatch):
+    defaults = {("version", "repo_path"): "/repo", ("jobs", "monitor_interval"): None}
+    monkeypatch.setattr(cli, "_default_param", lambda command, name: defaults.get((command, name)))
+    monkeypatch.setattr(cli, "_config_value", lambda path: "Ada" if path == "user.name" else None)
+
+    args = cli._build_parser("version").parse_args(
+        ["version", "commit", "--circuit-name", "bell", "--circuit-file", "c.qasm", "--message", "m"])
+    cli._apply_config_defaults(args)
+    assert (args.repo_path, args.author) == ("/repo", "Ada")
+
+    # Options given on the command line win; the interval keeps its 5s fallback
+    args = cli._build_parser("jobs").parse_args(["jobs", "monitor", "--storage-path", "/jobs"])
+    cli._apply_config_defaults(args)
+    assert (args.storage_path, args.interval) == ("/jobs", 5)
@@ -0,0 +1,167 @@
+"""
+Tests for plugin discovery and the plugin file cache.
+"""
+
+import os
+
+import pytest
+
+from quantum_cli_sdk import plugin_system
+
+
+PLUGIN_SOURCE = '''
+from quantum_cli_sdk.plugin_system import CommandPlugin, register_command_plugin
+
+
+class {cls}(CommandPlugin):
+    """{name} command"""
+    name = "{name}"
+
+    def execute(self, args):
+        return 0
+
+
+register_command_plugin({cls}())
+'''
+
+
+def write_plugin(directory, name):
+    path = directory / f"{name}_plugin.py"
+    path.write_text(PLUGIN_SOURCE.format(cls=f"{name.capitalize()}Plugin", name=name))
+    return str(path)
+
+
+@pytest.fixture
+def plugin_env(tmp_path, monkeypatch):
+    """An empty plugin registry, a cache file under tmp_path and a record of imported files."""
+    monkeypatch.setattr(plugin_system, "PLUGIN_CACHE_FILE", str(tmp_path / "cache" / "plugins.pkl"))
+    monkeypatch.setattr(plugin_system, "_command_plugins", {})
+    monkeypatch.setattr(plugin_system, "_transpiler_plugins", {})
+    monkeypatch.setattr(plugin_system, "_deferred_plugin_files", [])
+    monkeypatch.setattr(plugin_system, "_registered_command_names", [])
+
+    imported = []
+    load = plugin_system._load_plugin_module
+
+    def recording_load(plugin_path):
+        imported.append(os.path.basename(plugin_path))
+        return load(plugin_path)
+
+    monkeypatch.setattr(plugin_system, "_load_plugin_module", recording_load)
+
+    plugin_dir = tmp_path / "plugins"
+    plugin_dir.mkdir()
+    write_plugin(plugin_dir, "alpha")
+    (plugin_dir / "helper.py").write_text("VALUE = 1\n")
+    return plugin_dir, imported
+
+
+def test_cache_hit_imports_only_plugin_files(plugin_env):
+    plugin_dir, imported = plugin_env
+
+    assert plugin_system.discover_plugins([str(plugin_dir)]) == 1
+    assert sorted(imported) == ["alpha_plugin.py", "helper.py"]
+
+    imported.clear()
+    assert plugin_system.discover_plugins([str(plugin_dir)]) == 1
+    assert imported == ["alpha_plugin.py"]
+
+
+def test_cache_miss_after_touching_a_plugin_file(plugin_env):
+    plugin_dir, imported = plugin_env
+    plugin_system.discover_plugins([str(plugin_dir)])
+
+    helper = plugin_dir / "helper.py"
+    st = os.stat(helper)
+    os.utime(helper, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    imported.clear()
+    plugin_system.discover_plugins([str(plugin_dir)])
+    assert sorted(imported) == ["alpha_plugin.py", "helper.py"]
+
+
+def test_corrupt_cache_file_is_rescanned_and_replaced(plugin_env):
+    plugin_dir, imported = plugin_env
+    plugin_system.discover_plugins([str(plugin_dir)])
+
+    # A truncated pickle, as an interrupted non-atomic write would leave
+    with open(plugin_system.PLUGIN_CACHE_FILE, "r+b") as f:
+        f.truncate(10)
+
+    imported.clear()
+    assert plugin_system.discover_plugins([str(plugin_dir)]) == 1
+    assert sorted(imported) == ["alpha_plugin.py", "helper.py"]
+
+    # The rescan wrote a complete cache again
+    imported.clear()
+    plugin_system.discover_plugins([str(plugin_dir)])
+    assert imported == ["alpha_plugin.py"]
+
+
+def test_failed_cache_write_keeps_previous_file(plugin_env, monkeypatch):
+    plugin_dir, _ = plugin_env
+    plugin_system.discover_plugins([str(plugin_dir)])
+    with open(plugin_system.PLUGIN_CACHE_FILE, "rb") as f:
+        previous = f.read()
+
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+
+    with monkeypatch.context() as m:
+        m.setattr(plugin_system.os, "replace", fail_replace)
+        plugin_system._write_plugin_cache("other-key", [])
+
+    with open(plugin_system.PLUGIN_CACHE_FILE, "rb") as f:
+        assert f.read() == previous
+    assert os.listdir(os.path.dirname(plugin_system.PLUGIN_CACHE_FILE)) == ["plugins.pkl"]
+
+
+def test_command_cache_hit_defers_other_command_plugins(plugin_env):
+    plugin_dir, imported = plugin_env
+    write_plugin(plugin_dir, "beta")
+    # Helper modules are imported on a full scan but not counted
+    assert plugin_system.discover_plugins([str(plugin_dir)]) == 2
+
+    plugin_system._command_plugins.clear()
+    imported.clear()
+    assert plugin_system.discover_plugins([str(plugin_dir)], command="alpha") == 1
+    assert imported == ["alpha_plugin.py"]
+    assert list(plugin_system._command_plugins) == ["alpha"]
+
+    # Listing the registry loads the deferred plugin
+    assert sorted(plugin_system.get_registered_command_plugins()) == ["alpha", "beta"]
+    assert imported == ["alpha_plugin.py", "beta_plugin.py"]
+
+
+def test_cache_hit_without_command_loads_every_plugin(plugin_env):
+    plugin_dir, imported = plugin_env
+    write_plugin(plugin_dir, "beta")
+    plugin_system.discover_plugins([str(plugin_dir)])
+
+    plugin_system._command_plugins.clear()
+    imported.clear()
+    assert plugin_system.discover_plugins([str(plugin_dir)], command=None) == 2
+    assert sorted(imported) == ["alpha_plugin.py", "beta_plugin.py"]
+    assert plugin_system._deferred_plugin_files == []
+
+
+class EarlierBetaPlugin(plugin_system.CommandPlugin):
+    """beta command"""
+    name = "beta"
+
+    def execute(self, args):
+        return 0
+
+
+def test_plugin_overriding_a_registered_command_is_still_deferred(plugin_env):
+    plugin_dir, imported = plugin_env
+    write_plugin(plugin_dir, "beta")
+    # beta is already registered (e.g. by an earlier discovery) when the scan imports its file
+    plugin_system.register_command_plugin(EarlierBetaPlugin())
+    plugin_system.discover_plugins([str(plugin_dir)])
+
+    plugin_system._command_plugins.clear()
+    imported.clear()
+    plugin_system.discover_plugins([str(plugin_dir)], command="alpha")
+    assert imported == ["alpha_plugin.py"]
+    assert plugin_system._deferred_plugin_files == [str(plugin_dir / "beta_plugin.py")]